@@ -6,12 +6,37 @@ import json
 import sys
 import time
 import timeit
+from contextlib import contextmanager
 from pathlib import Path
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from zenith_analyser import ASTUnparser, Lexer, Parser, ZenithAnalyser
+from zenith_analyser import (
+    ASTUnparser,
+    Lexer,
+    Parser,
+    Validator,
+    ZenithAnalyser,
+    clear_frontend_cache,
+    set_frontend_cache_limit,
+)
+
+
+@contextmanager
+def frontend_cache_disabled():
+    """Make every ZenithAnalyser lex, parse and validate from scratch.
+
+    The frontend cache is off by default, but a caller may have enabled it;
+    switching it off keeps repeated runs timing the analysis rather than
+    cache hits.
+    """
+    previous = set_frontend_cache_limit(0)
+    clear_frontend_cache()
+    try:
+        yield
+    finally:
+        set_frontend_cache_limit(previous)
 
 
 class PerformanceBenchmark:
@@ -210,10 +235,11 @@ end_target
         ]:
             print(f"\nTesting {size} code...")
 
-            # Time complete analysis
-            start_time = time.time()
-            analyser = ZenithAnalyser(code)
-            initialization_time = time.time() - start_time
+            # Time complete analysis (uncached frontend)
+            with frontend_cache_disabled():
+                start_time = time.time()
+                analyser = ZenithAnalyser(code)
+                initialization_time = time.time() - start_time
 
             # Time law analysis
             law_names = analyser.law_analyser.get_law_names()
@@ -357,6 +383,42 @@ end_target
         self.results["unparser"] = results
         return results
 
+    def benchmark_validator(self, number=20):
+        """Benchmark Validator hot paths (code, tokens and law data)."""
+        print("\n" + "=" * 60)
+        print("VALIDATOR PERFORMANCE BENCHMARK")
+        print("=" * 60)
+
+        results = {}
+
+        for size, code in [
+            ("Small", self.small_code),
+            ("Medium", self.medium_code),
+            ("Large", self.large_code),
+        ]:
+            print(f"\nTesting {size} code...")
+
+            # Inputs are built outside the timed calls
+            analyser = ZenithAnalyser(code)
+            tokens = analyser.tokens
+            law_data = next(iter(analyser.law_analyser.laws.values()))
+            validator = Validator()
+
+            timings = {}
+            for name, call in [
+                ("validate_code", lambda: validator.validate_code(code)),
+                ("validate_tokens", lambda: validator.validate_tokens(tokens)),
+                ("validate_law_data", lambda: validator.validate_law_data(law_data)),
+            ]:
+                best = min(timeit.repeat(call, number=number, repeat=3)) / number
+                timings[f"{name}_seconds"] = best
+                print(f"  {name}: {best * 1000:.3f}ms")
+
+            results[size] = {"token_count": len(tokens), **timings}
+
+        self.results["validator"] = results
+        return results
+
     def benchmark_concurrent_analysis(self):
         """Benchmark concurrent analysis performance."""
         print("\n" + "=" * 60)
@@ -373,26 +435,29 @@ end_target
         code = self.medium_code
         num_concurrent = 10
 
-        print(f"\nTesting {num_concurrent} concurrent analyses...")
+        print(f"\nTesting {num_concurrent} concurrent analyses (uncached frontend)...")
 
-        # Sequential analysis
-        start_time = time.time()
-        for _ in range(num_concurrent):
-            analyser = ZenithAnalyser(code)
-            analyser.analyze_corpus()
-        sequential_time = time.time() - start_time
-
-        # Concurrent analysis
-        start_time = time.time()
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            futures = []
+        with frontend_cache_disabled():
+            # Sequential analysis
+            start_time = time.time()
             for _ in range(num_concurrent):
-                future = executor.submit(lambda: ZenithAnalyser(code).analyze_corpus())
-                futures.append(future)
+                analyser = ZenithAnalyser(code)
+                analyser.analyze_corpus()
+            sequential_time = time.time() - start_time
+
+            # Concurrent analysis
+            start_time = time.time()
+            with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+                futures = []
+                for _ in range(num_concurrent):
+                    future = executor.submit(
+                        lambda: ZenithAnalyser(code).analyze_corpus()
+                    )
+                    futures.append(future)
 
-            # Wait for all to complete
-            concurrent.futures.wait(futures)
-        concurrent_time = time.time() - start_time
+                # Wait for all to complete
+                concurrent.futures.wait(futures)
+            concurrent_time = time.time() - start_time
 
         results = {
             "sequential_time_seconds": sequential_time,
@@ -418,6 +483,7 @@ end_target
         self.benchmark_zenith_analyser()
         self.benchmark_memory_usage()
         self.benchmark_unparser()
+        self.benchmark_validator()
         self.benchmark_concurrent_analysis()
 
         # Generate summary
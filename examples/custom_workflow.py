@@ -17,6 +17,7 @@ Custom workflow examples for Zenith Analyser.
 """
 
 import csv
+import io
 import json
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
@@ -814,6 +815,19 @@ end_target
     }
 
 
+def _csv_snippet(data: Dict[str, Any]) -> str:
+    """Render the first timeline rows as CSV text."""
+    rows = data.get("timeline_data", [])[:3]
+    if not rows:
+        return ""
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=list(rows[0].keys()))
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
 def workflow_5_custom_report_generation():
     """Workflow 5: Custom report generation with multiple formats."""
     print("\n" + "=" * 60)
@@ -994,9 +1008,7 @@ end_target
     report_formats = {
         "json": lambda data: json.dumps(data, indent=2),
         "summary_text": lambda data: f"Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M')}\nTotal entries: {len(data.get('timeline_data', []))}",
-        "csv_snippet": lambda data: "\n".join(
-            [",".join(row.keys()) for row in data.get("timeline_data", [][:3])]
-        ),
+        "csv_snippet": _csv_snippet,
     }
 
     exported_reports = {}
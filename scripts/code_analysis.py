@@ -18,13 +18,74 @@ Analyzes code complexity, metrics, and generates reports.
 """
 
 import ast
+import hashlib
 import json
 import os
 import sys
+from collections import OrderedDict
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List
-
-import tabulate
+from typing import Any, Dict, Iterator, List, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Node types that each add one branch to the cyclomatic complexity
+_DECISION_NODES = frozenset(
+    {
+        ast.If,
+        ast.While,
+        ast.For,
+        ast.AsyncFor,
+        ast.Try,
+        ast.ExceptHandler,
+        ast.Assert,
+        ast.And,
+        ast.Or,
+    }
+)
+
+
+# Parsed trees keyed by content digest, so identical files parse only once
+_AST_CACHE_SIZE = 1024
+_ast_cache: "OrderedDict[bytes, ast.AST]" = OrderedDict()
+
+
+def _parse_cached(data: bytes, filename: str = "<unknown>") -> ast.AST:
+    """Parse source bytes, reusing the tree of any identical earlier content."""
+    key = hashlib.blake2b(data, digest_size=16).digest()
+    tree = _ast_cache.get(key)
+    if tree is not None:
+        _ast_cache.move_to_end(key)
+        return tree
+
+    tree = ast.parse(data, filename=filename)
+    _ast_cache[key] = tree
+    if len(_ast_cache) > _AST_CACHE_SIZE:
+        _ast_cache.popitem(last=False)
+    return tree
+
+
+def _dumps(data: Any) -> str:
+    """Serialize data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, indent=2)
+
+
+def _walk_py(root: Path) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for every Python file below root."""
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield entry
 
 
 class CodeAnalyzer:
@@ -34,10 +95,11 @@ class CodeAnalyzer:
         self.directory = Path(directory)
         self.results: Dict[str, Any] = {"files": {}, "summary": {}, "issues": []}
 
-    def analyze_file(self, filepath: Path) -> Dict[str, Any]:
-        """Analyze a single Python file."""
+    def analyze_file(self, filepath: Union[Path, os.DirEntry]) -> Dict[str, Any]:
+        """Analyze a single Python file, given as a Path or a scandir entry."""
         metrics = {
-            "filename": str(filepath),
+            "filename": os.fspath(filepath),
+            "basename": filepath.name,
             "lines": 0,
             "functions": 0,
             "classes": 0,
@@ -48,21 +110,20 @@ class CodeAnalyzer:
         }
 
         try:
-            with open(filepath, "r", encoding="utf-8") as f:
-                content = f.read()
-                metrics["lines"] = len(content.splitlines())
+            with open(filepath, "rb") as f:
+                data = f.read()
+                lines = data.splitlines()
+                metrics["lines"] = len(lines)
 
-                # Count comments and docstrings
-                lines = content.splitlines()
+                # Count comments and docstrings on raw bytes, no decoding needed
                 for line in lines:
-                    stripped = line.strip()
-                    if stripped.startswith("#"):
+                    if line.lstrip().startswith(b"#"):
                         metrics["comments"] += 1
-                    elif '"""' in line or "'''" in line:
+                    elif b'"""' in line or b"'''" in line:
                         metrics["docstrings"] += 1
 
-                # Parse AST for more detailed analysis
-                tree = ast.parse(content)
+                # Parse AST for more detailed analysis (ast decodes bytes itself)
+                tree = _parse_cached(data, filename=os.fspath(filepath))
 
                 # Count functions and classes
                 metrics["functions"] = len(
@@ -90,7 +151,7 @@ class CodeAnalyzer:
         except (SyntaxError, UnicodeDecodeError) as e:
             self.results["issues"].append(
                 {
-                    "file": str(filepath),
+                    "file": os.fspath(filepath),
                     "issue": f"Parse error: {str(e)}",
                     "severity": "error",
                 }
@@ -103,29 +164,22 @@ class CodeAnalyzer:
         complexity = 1  # Base complexity
 
         for node in ast.walk(tree):
-            if isinstance(
-                node,
-                (
-                    ast.If,
-                    ast.While,
-                    ast.For,
-                    ast.AsyncFor,
-                    ast.Try,
-                    ast.ExceptHandler,
-                    ast.Assert,
-                ),
-            ):
-                complexity += 1
-            elif isinstance(node, (ast.And, ast.Or)):
+            node_type = type(node)
+            if node_type in _DECISION_NODES:
                 complexity += 1
-            elif isinstance(node, ast.BoolOp):
+            elif node_type is ast.BoolOp:
                 complexity += len(node.values) - 1
 
         return complexity
 
     def analyze_directory(self) -> Dict[str, Any]:
         """Analyze all Python files in directory."""
-        python_files = list(self.directory.rglob("*.py"))
+        if not self.directory.is_dir():
+            print(f"No Python files found in {self.directory}")
+            return self.results
+
+        # Sorted by path so reports do not depend on scandir order.
+        python_files = sorted(_walk_py(self.directory), key=attrgetter("path"))
 
         if not python_files:
             print(f"No Python files found in {self.directory}")
@@ -133,10 +187,11 @@ class CodeAnalyzer:
 
         print(f"Analyzing {len(python_files)} Python files...")
 
-        for filepath in python_files:
-            relative_path = filepath.relative_to(self.directory.parent)
-            metrics = self.analyze_file(filepath)
-            self.results["files"][str(relative_path)] = metrics
+        base = os.fspath(self.directory.parent)
+        for entry in python_files:
+            relative_path = os.path.relpath(entry.path, base)
+            metrics = self.analyze_file(entry)
+            self.results["files"][relative_path] = metrics
 
         # Calculate summary statistics
         self._calculate_summary()
@@ -150,27 +205,35 @@ class CodeAnalyzer:
         if not files:
             return
 
+        # Accumulate every total in a single pass over the files
+        total_lines = total_functions = total_classes = 0
+        total_complexity = total_comments = 0
+        for f in files:
+            total_lines += f["lines"]
+            total_functions += f["functions"]
+            total_classes += f["classes"]
+            total_complexity += f["complexity"]
+            total_comments += f["comments"]
+
         self.results["summary"] = {
             "total_files": len(files),
-            "total_lines": sum(f["lines"] for f in files),
-            "total_functions": sum(f["functions"] for f in files),
-            "total_classes": sum(f["classes"] for f in files),
-            "average_complexity": sum(f["complexity"] for f in files) / len(files),
+            "total_lines": total_lines,
+            "total_functions": total_functions,
+            "total_classes": total_classes,
+            "average_complexity": total_complexity / len(files),
             "files_with_issues": len(self.results["issues"]),
-            "lines_per_function": sum(f["lines"] for f in files)
-            / max(sum(f["functions"] for f in files), 1),
-            "comment_ratio": (
-                sum(f["comments"] for f in files) / sum(f["lines"] for f in files)
-            )
-            * 100,
+            "lines_per_function": total_lines / max(total_functions, 1),
+            "comment_ratio": (total_comments / total_lines) * 100,
         }
 
     def print_report(self, output_format: str = "table") -> None:
         """Print analysis report."""
         if output_format == "json":
-            print(json.dumps(self.results, indent=2))
+            print(_dumps(self.results))
             return
 
+        from tabulate import tabulate
+
         # Print summary
         print("\n" + "=" * 60)
         print("CODE ANALYSIS SUMMARY")
@@ -188,7 +251,7 @@ class CodeAnalyzer:
             ["Files with Issues", summary["files_with_issues"]],
         ]
 
-        print(tabulate.tabulate(summary_data, tablefmt="grid"))
+        print(tabulate(summary_data, tablefmt="grid"))
 
         # Print file details
         if output_format == "detailed":
@@ -196,18 +259,17 @@ class CodeAnalyzer:
             print("FILE DETAILS")
             print("=" * 60)
 
-            file_data = []
-            for filename, metrics in self.results["files"].items():
-                file_data.append(
-                    [
-                        os.path.basename(filename),
-                        metrics["lines"],
-                        metrics["functions"],
-                        metrics["classes"],
-                        metrics["complexity"],
-                        metrics["comments"],
-                    ]
-                )
+            file_data = [
+                [
+                    metrics["basename"],
+                    metrics["lines"],
+                    metrics["functions"],
+                    metrics["classes"],
+                    metrics["complexity"],
+                    metrics["comments"],
+                ]
+                for metrics in self.results["files"].values()
+            ]
 
             headers = [
                 "File",
@@ -217,7 +279,7 @@ class CodeAnalyzer:
                 "Complexity",
                 "Comments",
             ]
-            print(tabulate.tabulate(file_data, headers=headers, tablefmt="grid"))
+            print(tabulate(file_data, headers=headers, tablefmt="grid"))
 
         # Print issues
         if self.results["issues"]:
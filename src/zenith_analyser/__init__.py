@@ -25,40 +25,103 @@ __email__ = "frasasudev@gmail.com"
 __license__ = "Apache 2.0"
 __copyright__ = "Copyright 2026 François TUMUSAVYEYESU"
 
-from .analysers import LawAnalyser, TargetAnalyser, ZenithAnalyser
-from .metrics import ZenithMetrics
-from .visuals import ZenithVisualizer, create_simple_plot
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+# Public names and the submodule that defines them. Submodules are imported
+# on first attribute access (PEP 562) so that ``import zenith_analyser`` stays
+# cheap and does not pull in pandas/matplotlib unless they are needed.
+_LAZY_IMPORTS = {
+    # Core classes
+    "Lexer": ".lexer",
+    "Parser": ".parser",
+    "LawAnalyser": ".analysers",
+    "TargetAnalyser": ".analysers",
+    "ZenithAnalyser": ".analysers",
+    "ASTUnparser": ".unparser",
+    "Validator": ".validator",
+    "ZenithVisualizer": ".visuals",
+    "ZenithMetrics": ".metrics",
+    # Utility functions
+    "point_to_minutes": ".utils",
+    "minutes_to_point": ".utils",
+    "validate_zenith_code": ".utils",
+    "load_corpus": ".utils",
+    "load_ics": ".utils",
+    "create_simple_plot": ".visuals",
+    "validate_identifier": ".utils",
+    "load_simulations": ".utils",
+    "simulations_ics": ".utils",
+    "export_zenith": ".utils",
+    "simulations_timezone": ".utils",
+    "zenith_to_local": ".utils",
+    "format_code": ".utils",
+    "set_frontend_cache_limit": ".analysers",
+    "clear_frontend_cache": ".analysers",
+    # Exceptions
+    "ZenithError": ".exceptions",
+    "ZenithLexerError": ".exceptions",
+    "ZenithParserError": ".exceptions",
+    "ZenithAnalyserError": ".exceptions",
+    "ZenithValidationError": ".exceptions",
+    # Constants
+    "TOKEN_TYPES": ".constants",
+    "TIME_UNITS": ".constants",
+    "ZENITH_KEYWORDS": ".constants",
+}
+
+if TYPE_CHECKING:
+    from .analysers import (
+        LawAnalyser,
+        TargetAnalyser,
+        ZenithAnalyser,
+        clear_frontend_cache,
+        set_frontend_cache_limit,
+    )
+    from .constants import TIME_UNITS, TOKEN_TYPES, ZENITH_KEYWORDS
+    from .exceptions import (
+        ZenithAnalyserError,
+        ZenithError,
+        ZenithLexerError,
+        ZenithParserError,
+        ZenithValidationError,
+    )
+    from .lexer import Lexer
+    from .metrics import ZenithMetrics
+    from .parser import Parser
+    from .unparser import ASTUnparser
+    from .utils import (
+        export_zenith,
+        format_code,
+        load_corpus,
+        load_ics,
+        load_simulations,
+        minutes_to_point,
+        point_to_minutes,
+        simulations_ics,
+        simulations_timezone,
+        validate_identifier,
+        validate_zenith_code,
+        zenith_to_local,
+    )
+    from .validator import Validator
+    from .visuals import ZenithVisualizer, create_simple_plot
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining ``name`` on first access."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
-# Constants
-from .constants import TIME_UNITS, TOKEN_TYPES, ZENITH_KEYWORDS
 
-# Exceptions
-from .exceptions import (
-    ZenithAnalyserError,
-    ZenithError,
-    ZenithLexerError,
-    ZenithParserError,
-    ZenithValidationError,
-)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Core classes
-from .lexer import Lexer
-from .parser import Parser
-from .unparser import ASTUnparser
-from .utils import(
-     minutes_to_point,
-     point_to_minutes,
-     validate_zenith_code,
-     load_corpus,load_ics,
-     validate_identifier,
-     load_simulations,
-     simulations_ics,
-     export_zenith,
-     simulations_timezone,
-     zenith_to_local,
-     format_code
-)
-from .validator import Validator
 
 __all__ = [
     # Core classes
@@ -85,6 +148,8 @@ __all__ = [
     "simulations_timezone",
     "zenith_to_local",
     "format_code",
+    "set_frontend_cache_limit",
+    "clear_frontend_cache",
     # Exceptions
     "ZenithError",
     "ZenithLexerError",
@@ -19,10 +19,24 @@ Analyzers for Zenith language structures.
 Contains LawAnalyser, TargetAnalyser, and ZenithAnalyser classes.
 """
 
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Tuple
-import copy
+from functools import cached_property
+from types import MappingProxyType
+from itertools import accumulate
+from operator import add, itemgetter
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
+import hashlib
+import heapq
 import json
+import pickle
+import sys
+import threading
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .exceptions import ZenithAnalyserError, ZenithTimeError, ZenithValidationError
 from .utils import (
@@ -31,12 +45,240 @@ from .utils import (
     minutes_to_point,
     parse_datetime,
     point_to_minutes,
-    calculate_duration,
+    points_to_minutes,
     load_simulations,
     zenith_to_local
 )
 
 
+def _copy_entries(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Copy a list of flat entry dicts (dictionnary entries or group events).
+
+    Args:
+        entries: Entries produced by the parser
+
+    Returns:
+        New list holding a shallow copy of every entry
+    """
+    return [dict(entry) for entry in entries]
+
+
+def _copy_law(law: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy law data down to its mutable entries.
+
+    The AST node kept under ``source_node`` is shared, not copied.
+
+    Args:
+        law: Law data as built by LawAnalyser
+
+    Returns:
+        Independent copy of the law data
+    """
+    copied = dict(law)
+    copied["dictionnary"] = _copy_entries(law.get("dictionnary", []))
+    copied["group"] = _copy_entries(law.get("group", []))
+    return copied
+
+
+def _entries_view(entries: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """
+    Build a read-only view of a list of flat entry dicts.
+
+    Args:
+        entries: Dictionnary entries or group events
+
+    Returns:
+        Tuple of read-only mappings over the original entries
+    """
+    return tuple(MappingProxyType(entry) for entry in entries)
+
+
+_ONE_MINUTE = timedelta(minutes=1)
+_now = datetime.now
+
+# Law schema, checked by LawAnalyser.validate_law.
+_LAW_REQUIRED_FIELDS = ("date", "time", "period", "dictionnary", "group")
+_GROUP_EVENT_FIELDS = ("name", "chronocoherence", "chronodispersal")
+_GROUP_EVENT_FIELDS_SET = frozenset(_GROUP_EVENT_FIELDS)
+
+# Opt-in cache of validated frontends keyed by a digest of the source code, so
+# that re-analysing identical code skips lexing, parsing and validation. Entries
+# are stored pickled: every hit unpickles a private copy, so analysers built
+# from the same code never share mutable tokens or AST nodes. Disabled (limit 0)
+# until set_frontend_cache_limit is called.
+_frontend_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+_frontend_cache_limit = 0
+_frontend_cache_bytes = 0
+_frontend_cache_lock = threading.Lock()
+_EVENT_START = itemgetter(0)
+_COHERENCE = itemgetter("chronocoherence")
+_DISPERSAL = itemgetter("chronodispersal")
+
+
+def set_frontend_cache_limit(max_bytes: int) -> int:
+    """
+    Set the memory limit of the ZenithAnalyser frontend cache.
+
+    When the limit is positive, ZenithAnalyser keeps the validated tokens and
+    AST of analysed code, so that analysing identical code again skips lexing,
+    parsing and validation. Least recently used entries are evicted to stay
+    within the limit.
+
+    Args:
+        max_bytes: Maximum size of the pickled entries, 0 to disable the cache
+
+    Returns:
+        Previous limit in bytes
+
+    Raises:
+        ValueError: If max_bytes is negative
+    """
+    global _frontend_cache_limit
+    if max_bytes < 0:
+        raise ValueError(f"Cache limit must be non-negative, got {max_bytes}")
+    with _frontend_cache_lock:
+        previous = _frontend_cache_limit
+        _frontend_cache_limit = max_bytes
+        _evict_frontend_cache()
+    return previous
+
+
+def clear_frontend_cache() -> None:
+    """Remove every entry from the ZenithAnalyser frontend cache."""
+    global _frontend_cache_bytes
+    with _frontend_cache_lock:
+        _frontend_cache.clear()
+        _frontend_cache_bytes = 0
+
+
+def _evict_frontend_cache() -> None:
+    """Drop least recently used entries until the cache fits its limit."""
+    global _frontend_cache_bytes
+    while _frontend_cache and _frontend_cache_bytes > _frontend_cache_limit:
+        _, entry = _frontend_cache.popitem(last=False)
+        _frontend_cache_bytes -= len(entry)
+
+
+def _event_offsets(
+    coherences: List[int], dispersals: List[int]
+) -> List[Tuple[int, int]]:
+    """
+    Compute start and end offsets in minutes for a sequence of events.
+
+    Each event lasts its chronocoherence and is followed by its
+    chronodispersal, except the last one.
+
+    Args:
+        coherences: Chronocoherence of each event in minutes
+        dispersals: Chronodispersal after each event but the last, in minutes
+
+    Returns:
+        List of (start, end) offsets from the first event's start
+    """
+    offsets = []
+    current = 0
+    for index, coherence in enumerate(coherences):
+        end = current + coherence
+        offsets.append((current, end))
+        current = end
+        if index < len(dispersals):
+            current += dispersals[index]
+    return offsets
+
+
+def _timeline_segments(
+    events: List[Tuple[datetime, str, str, datetime]]
+) -> List[Tuple[datetime, str, datetime]]:
+    """
+    Split merged events into segments of constant overlap.
+
+    Sweeps the boundaries once, keeping the events active across each
+    segment; a segment's title joins them, latest first.
+
+    Args:
+        events: (start, law_name, description, end) tuples sorted by start
+
+    Returns:
+        (start, title, end) tuples for every non-empty segment
+    """
+    starting: Dict[datetime, List[int]] = defaultdict(list)
+    ending: Dict[datetime, List[int]] = defaultdict(list)
+    for index, (start, _, _, end) in enumerate(events):
+        starting[start].append(index)
+        ending[end].append(index)
+
+    time_points = sorted(starting.keys() | ending.keys())
+
+    # Indices are added in start order, so the dict stays in event order.
+    active: Dict[int, str] = {}
+    segments = []
+    for start, end in zip(time_points, time_points[1:]):
+        for index in starting.get(start, ()):
+            active[index] = events[index][2]
+        for index in ending.get(start, ()):
+            del active[index]
+        if active:
+            segments.append((start, "|".join(reversed(active.values())), end))
+    return segments
+
+
+def _segments_group(
+    segments: List[Tuple[datetime, str, datetime]]
+) -> List[Dict[str, str]]:
+    """
+    Turn timeline segments into GROUP entries.
+
+    Args:
+        segments: (start, title, end) tuples from _timeline_segments
+
+    Returns:
+        Group entries whose dispersal reaches the next segment's start
+    """
+    group = []
+    for (start, title, end), following in zip(segments, [*segments[1:], None]):
+        coherence_minutes = (end - start) // _ONE_MINUTE
+        dispersal_minutes = (
+            (following[0] - end) // _ONE_MINUTE if following is not None else 0
+        )
+        group.append(
+            {
+                "name": title,
+                "chronocoherence": (
+                    minutes_to_point(coherence_minutes)
+                    if coherence_minutes > 0
+                    else "0"
+                ),
+                "chronodispersal": minutes_to_point(max(0, dispersal_minutes)),
+            }
+        )
+    return group
+
+
+def _copy_description(description: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a law description down to its nested lists and dicts.
+
+    Args:
+        description: Result of ZenithAnalyser.law_description_data
+
+    Returns:
+        Independent copy of the description
+    """
+    copied = dict(description)
+    copied["start_datetime"] = dict(description["start_datetime"])
+    copied["end_datetime"] = dict(description["end_datetime"])
+    copied["simulation"] = [
+        {**entry, "start": dict(entry["start"]), "end": dict(entry["end"])}
+        for entry in description["simulation"]
+    ]
+    copied["event_metrics"] = _copy_entries(description["event_metrics"])
+    copied["dispersion_metrics"] = _copy_entries(description["dispersion_metrics"])
+    copied["events"] = list(description["events"])
+    return copied
+
+
 class LawAnalyser:
     """
     Analyzer for individual laws.
@@ -66,16 +308,17 @@ class LawAnalyser:
         """
         data_laws = {}
 
-        def _traverse(elements: List[Dict[str, Any]]) -> None:
-            for element in elements:
-                if element.get("type") == "law":
-                    self._extract_law_data(element, data_laws)
-                elif element.get("type") == "target":
-                    contents = element.get("contents", {})
-                    blocks = contents.get("blocks", [])
-                    _traverse(blocks)
+        # Explicit stack in document order (children pushed reversed).
+        stack = list(reversed(ast.get("elements", [])))
+        while stack:
+            element = stack.pop()
+            element_type = element.get("type")
+            if element_type == "law":
+                self._extract_law_data(element, data_laws)
+            elif element_type == "target":
+                contents = element.get("contents", {})
+                stack.extend(reversed(contents.get("blocks", [])))
 
-        _traverse(ast.get("elements", []))
         return data_laws
 
     def _extract_law_data(
@@ -92,6 +335,9 @@ class LawAnalyser:
         if not name:
             return
 
+        # Names end up as dict keys and set members all over the analysers;
+        # interning lets those comparisons short-circuit on identity.
+        name = sys.intern(name)
         contents = law_node.get("contents", {})
         start_date = contents.get("start_date", {})
 
@@ -100,8 +346,8 @@ class LawAnalyser:
             "date": start_date.get("date"),
             "time": start_date.get("time"),
             "period": contents.get("period"),
-            "dictionnary": contents.get("events", []).copy(),
-            "group": contents.get("group", []).copy(),
+            "dictionnary": _copy_entries(contents.get("events", [])),
+            "group": _copy_entries(contents.get("group", [])),
             "source_node": law_node,  # Keep reference for debugging
         }
 
@@ -118,13 +364,38 @@ class LawAnalyser:
         """
         Get a specific law by name.
 
+        The entries are private copies; ``source_node`` still refers to the
+        parsed AST.
+
         Args:
             name: Law name
 
         Returns:
             Law data or None if not found
         """
-        return copy.deepcopy(self.laws.get(name)) if name in self.laws else None
+        law = self.laws.get(name)
+        return _copy_law(law) if law is not None else None
+
+    def get_law_view(self, name: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a read-only view of a specific law without copying it.
+
+        Lists are exposed as tuples and entries as read-only mappings.
+
+        Args:
+            name: Law name
+
+        Returns:
+            Read-only law data or None if not found
+        """
+        law = self.laws.get(name)
+        if law is None:
+            return None
+
+        view = dict(law)
+        view["dictionnary"] = _entries_view(law["dictionnary"])
+        view["group"] = _entries_view(law["group"])
+        return MappingProxyType(view)
 
     def validate_law(self, name: str) -> List[str]:
         """
@@ -136,14 +407,13 @@ class LawAnalyser:
         Returns:
             List of validation errors
         """
-        law = self.get_law(name)
+        law = self.laws.get(name)
         if not law:
             return [f"Law '{name}' not found"]
 
         errors = []
 
-        required = ["date", "time", "period", "dictionnary", "group"]
-        for field in required:
+        for field in _LAW_REQUIRED_FIELDS:
             if not law.get(field):
                 errors.append(f"Missing required field: {field}")
 
@@ -186,8 +456,9 @@ class LawAnalyser:
                     errors.append(f"Group event {i} must be a dictionary")
                     continue
 
-                required_fields = ["name", "chronocoherence", "chronodispersal"]
-                for field in required_fields:
+                if event.keys() >= _GROUP_EVENT_FIELDS_SET:
+                    continue
+                for field in _GROUP_EVENT_FIELDS:
                     if field not in event:
                         errors.append(f"Group event {i} missing '{field}'")
 
@@ -201,17 +472,25 @@ class TargetAnalyser:
     Extracts targets, analyzes relationships, and manages law inheritance.
     """
 
-    def __init__(self, ast: Dict[str, Any]):
+    def __init__(
+        self, ast: Dict[str, Any], law_analyser: Optional[LawAnalyser] = None
+    ):
         """
         Initialize the target analyzer.
 
         Args:
             ast: Abstract Syntax Tree from parser
+            law_analyser: Existing LawAnalyser for the same AST to reuse
         """
         self.ast = ast
-        self.law_analyser = LawAnalyser(ast)
+        self.law_analyser = (
+            law_analyser if law_analyser is not None else LawAnalyser(ast)
+        )
         self.targets = self.extract_targets(ast)
         self._populate_descendants()
+        self._index_targets()
+        # Laws resolved per target; the AST never changes after construction.
+        self._laws_for_target_cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
 
     def extract_targets(self, ast: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
         """
@@ -225,22 +504,23 @@ class TargetAnalyser:
         """
         data_targets = {}
 
-        def _traverse(
-            elements: List[Dict[str, Any]], current_path: List[str] = None
-        ) -> None:
-            if current_path is None:
-                current_path = []
+        # Explicit stack of (element, parent path) in document order.
+        stack: List[Tuple[Dict[str, Any], List[str]]] = [
+            (element, []) for element in reversed(ast.get("elements", []))
+        ]
+        while stack:
+            element, current_path = stack.pop()
+            if element.get("type") != "target":
+                continue
 
-            for element in elements:
-                if element.get("type") == "target":
-                    self._extract_target_data(element, data_targets, current_path)
+            self._extract_target_data(element, data_targets, current_path)
 
-                    contents = element.get("contents", {})
-                    blocks = contents.get("blocks", [])
-                    new_path = current_path + [element["name"]]
-                    _traverse(blocks, new_path)
+            contents = element.get("contents", {})
+            new_path = current_path + [sys.intern(element["name"])]
+            stack.extend(
+                (block, new_path) for block in reversed(contents.get("blocks", []))
+            )
 
-        _traverse(ast.get("elements", []))
         return data_targets
 
     def _extract_target_data(
@@ -261,12 +541,13 @@ class TargetAnalyser:
         if not name:
             return
 
+        name = sys.intern(name)
         contents = target_node.get("contents", {})
 
         data_targets[name] = {
             "name": name,
             "key": contents.get("key", ""),
-            "dictionnary": contents.get("dictionnary", []).copy(),
+            "dictionnary": _copy_entries(contents.get("dictionnary", [])),
             "direct_laws": [],
             "direct_targets": [],
             "all_descendants_laws": set(),
@@ -276,51 +557,82 @@ class TargetAnalyser:
             "source_node": target_node,
         }
 
-        blocks = contents.get("blocks", [])
-        for block in blocks:
-            if block.get("type") == "law":
-                law_name = block.get("name")
-                if law_name:
-                    data_targets[name]["direct_laws"].append(law_name)
-            elif block.get("type") == "target":
-                target_name = block.get("name")
-                if target_name:
-                    data_targets[name]["direct_targets"].append(target_name)
+        appenders = {
+            "law": data_targets[name]["direct_laws"].append,
+            "target": data_targets[name]["direct_targets"].append,
+        }
+        for block in contents.get("blocks", []):
+            block_name = block.get("name")
+            if not block_name:
+                continue
+            append = appenders.get(block.get("type"))
+            if append is not None:
+                append(sys.intern(block_name))
 
     def _populate_descendants(self) -> None:
         """
         Populate descendant sets for all targets.
         """
 
-        def _get_descendants(target_name: str) -> Tuple[Set[str], Set[str]]:
-            if target_name not in self.targets:
-                return set(), set()
+        # Order targets so that every child comes before its parent, using an
+        # explicit stack so deep hierarchies cannot hit the recursion limit.
+        visited: Set[str] = set()
+        post_order: List[str] = []
 
-            target = self.targets[target_name]
+        for root_name in self.targets:
+            if root_name in visited:
+                continue
+
+            stack: List[Tuple[str, bool]] = [(root_name, False)]
+            while stack:
+                target_name, children_done = stack.pop()
+                if children_done:
+                    post_order.append(target_name)
+                    continue
+                if target_name in visited:
+                    continue
 
-            if (
-                target["all_descendants_laws"]
-                and target["all_descendants_targets"]
-                and len(target["all_descendants_laws"]) > 0
-                and len(target["all_descendants_targets"]) > 0
-            ):
-                return target["all_descendants_laws"], target["all_descendants_targets"]
+                visited.add(target_name)
+                stack.append((target_name, True))
+                for child_name in self.targets[target_name]["direct_targets"]:
+                    if child_name in self.targets and child_name not in visited:
+                        stack.append((child_name, False))
 
+        for target_name in post_order:
+            target = self.targets[target_name]
+            children = [
+                self.targets[child_name]
+                for child_name in target["direct_targets"]
+                if child_name in self.targets
+            ]
+
+            # Fold all children in with a single C-level update per set.
             descendant_laws = set(target["direct_laws"])
+            descendant_laws.update(
+                *[child["all_descendants_laws"] for child in children]
+            )
             descendant_targets = set(target["direct_targets"])
-
-            for child_name in target["direct_targets"]:
-                child_laws, child_targets = _get_descendants(child_name)
-                descendant_laws.update(child_laws)
-                descendant_targets.update(child_targets)
+            descendant_targets.update(
+                *[child["all_descendants_targets"] for child in children]
+            )
 
             target["all_descendants_laws"] = descendant_laws
             target["all_descendants_targets"] = descendant_targets
 
-            return descendant_laws, descendant_targets
+    def _index_targets(self) -> None:
+        """
+        Build depth and key lookups over the extracted targets.
+        """
+        self._by_depth: Dict[int, List[str]] = defaultdict(list)
+        self._by_key: Dict[str, List[str]] = defaultdict(list)
+        self._max_depth = 0
 
-        for target_name in list(self.targets.keys()):
-            _get_descendants(target_name)
+        for name, target in self.targets.items():
+            depth = target["depth"]
+            self._by_depth[depth].append(name)
+            self._by_key[target.get("key")].append(name)
+            if depth > self._max_depth:
+                self._max_depth = depth
 
     def get_target_names(self) -> List[str]:
         return list(self.targets.keys())
@@ -328,12 +640,39 @@ class TargetAnalyser:
     def get_target(self, name: str) -> Optional[Dict[str, Any]]:
         return self.targets.get(name).copy() if name in self.targets else None
 
+    def get_target_view(self, name: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get a read-only view of a specific target without copying it.
+
+        Lists are exposed as tuples, sets as frozensets and dictionnary
+        entries as read-only mappings.
+
+        Args:
+            name: Target name
+
+        Returns:
+            Read-only target data or None if not found
+        """
+        target = self.targets.get(name)
+        if target is None:
+            return None
+
+        view = dict(target)
+        view["dictionnary"] = _entries_view(target["dictionnary"])
+        view["direct_laws"] = tuple(target["direct_laws"])
+        view["direct_targets"] = tuple(target["direct_targets"])
+        view["all_descendants_laws"] = frozenset(target["all_descendants_laws"])
+        view["all_descendants_targets"] = frozenset(
+            target["all_descendants_targets"]
+        )
+        view["path"] = tuple(target["path"])
+        return MappingProxyType(view)
+
     def get_target_hierarchy(self, name: str) -> Dict[str, Any]:
-        if name not in self.targets:
+        target = self.targets.get(name)
+        if target is None:
             raise ZenithAnalyserError(f"Target '{name}' not found", target_name=name)
 
-        target = self.targets[name]
-
         return {
             "name": name,
             "path": target["path"],
@@ -351,97 +690,124 @@ class TargetAnalyser:
                 f"Target '{name_target}' not found", target_name=name_target
             )
 
-        targets = copy.deepcopy(self.targets)
-        laws = copy.deepcopy(self.law_analyser.laws)
+        # Callers are free to mutate the result, so hand out a private copy.
+        return {
+            name: _copy_law(law)
+            for name, law in self._cached_laws_for_target(name_target).items()
+        }
+
+    def _cached_laws_for_target(
+        self, name_target: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the memoized laws of a target without copying them.
+
+        Args:
+            name_target: Target name
+
+        Returns:
+            Shared dictionary of transformed laws; must not be mutated
+        """
+        cached = self._laws_for_target_cache.get(name_target)
+        if cached is None:
+            cached = self._resolve_laws_for_target(name_target)
+            self._laws_for_target_cache[name_target] = cached
+        return cached
+
+    def _resolve_laws_for_target(
+        self, name_target: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve the laws of a target with inherited dictionnary descriptions.
+
+        Args:
+            name_target: Target name
+
+        Returns:
+            Dictionary of transformed laws indexed by name
+        """
+        targets = self.targets
+        # Only dictionnary entries are written to below, so copy just those,
+        # and only for the targets the walk can reach.
+        subtree = (name_target, *targets[name_target]["all_descendants_targets"])
+        dictionnaries = {
+            name: _copy_entries(targets[name]["dictionnary"]) for name in subtree
+        }
+        laws = self.law_analyser.laws
 
         data_laws = {}
 
-        def _traverse(target_name):
+        # Pre-order walk: a target rewrites its children's dictionnaries
+        # before they are visited, and deeper laws override shallower ones.
+        stack = [name_target]
+        while stack:
+            target_name = stack.pop()
             direct_laws_names = targets[target_name]["direct_laws"]
             direct_laws = {}
-            dictionnary = targets[target_name]["dictionnary"]
+            dictionnary = dictionnaries[target_name]
             direct_targets_names = targets[target_name].get("direct_targets", [])
 
             for name in direct_laws_names:
-                direct_laws[name] = copy.deepcopy(laws[name])
-
-            for dict_entry in dictionnary:
-                for name in direct_laws_names:
-                    for index, event in enumerate(direct_laws[name]["dictionnary"]):
-                        if dict_entry["name"] == event.get("index", ""):
-                            direct_laws[name]["dictionnary"][index]["description"] = (
-                                dict_entry["description"]
-                            )
-
+                direct_laws[name] = _copy_law(laws[name])
 
-                for name in direct_targets_names:
-                    for index, event in enumerate(targets[name]["dictionnary"]):
-                        if dict_entry["name"] == event.get("index", ""):
-                            targets[name]["dictionnary"][index]["description"] = (
-                                dict_entry["description"]
-                            )
+            desc_by_name = {
+                entry["name"]: entry["description"] for entry in dictionnary
+            }
 
-            for name in list(direct_laws.keys()):
-                data_laws[name] = copy.deepcopy(direct_laws[name])
+            for name in direct_laws_names:
+                for event in direct_laws[name]["dictionnary"]:
+                    index = event.get("index", "")
+                    if index in desc_by_name:
+                        event["description"] = desc_by_name[index]
 
             for name in direct_targets_names:
-                _traverse(name)
+                for event in dictionnaries[name]:
+                    index = event.get("index", "")
+                    if index in desc_by_name:
+                        event["description"] = desc_by_name[index]
 
-        _traverse(name_target)
+            data_laws.update(direct_laws)
+
+            stack.extend(reversed(direct_targets_names))
 
         return data_laws
 
     def get_targets_by_generation(self, generation: int) -> List[str]:
-        result = []
-        for name, target in self.targets.items():
-            if target["depth"] == generation:
-                result.append(name)
-        return result
+        return list(self._by_depth.get(generation, ()))
 
     def get_max_generation(self) -> int:
-        max_depth = 0
-        for target in self.targets.values():
-            if target["depth"] > max_depth:
-                max_depth = target["depth"]
-        return max_depth
+        return self._max_depth
 
     def get_targets_by_key(self, key: str) -> List[str]:
-        result = []
-        for name, target in self.targets.items():
-            if target.get("key") == key:
-                result.append(name)
-        return result
+        return list(self._by_key.get(key, ()))
 
-    def corp_extract_laws_transformed(
-        self, generation: int = 1
-    ) -> Dict[str, Dict[str, Any]]:
-        if generation < 1 or generation > self.get_max_generation():
+    def _check_generation(self, generation: int) -> None:
+        """
+        Ensure a generation level exists in the target hierarchy.
+
+        Args:
+            generation: Generation level
+
+        Raises:
+            ZenithValidationError: If the level is out of range
+        """
+        if generation < 1 or generation > self._max_depth:
             raise ZenithValidationError(
                 f"Generation level must be at least 1: "
-                f"{generation} or less than {self.get_max_generation()+1}",
+                f"{generation} or less than {self._max_depth + 1}",
                 validation_type="generation",
             )
 
-        data_laws = {}
-
-        paths = {}
-        targets_names = list(self.targets.keys())
-
-        for name in targets_names:
-            paths[name] = {
-                "name": name,
-                "path": self.targets[name]["path"],
-                "generation": len(self.targets[name]["path"]),
-            }
+    def corp_extract_laws_transformed(
+        self, generation: int = 1
+    ) -> Dict[str, Dict[str, Any]]:
+        self._check_generation(generation)
 
-        allowed_targets_name = [
-            name for name in targets_names if paths[name]["generation"] == generation
-        ]
+        data_laws = {}
 
-        for target_name in allowed_targets_name:
-            laws = self.extract_laws_for_target(target_name)
-            for name in laws:
-                data_laws[name] = laws[name].copy()
+        for target_name in self._by_depth.get(generation, ()):
+            # extract_laws_for_target already returns fresh copies.
+            data_laws.update(self.extract_laws_for_target(target_name))
 
         return data_laws
 
@@ -452,18 +818,24 @@ class TargetAnalyser:
                 validation_type="population",
             )
 
+        if population > 0:
+            self._check_generation(population)
+
+        # Within a generation the last target defining a law name wins, as in
+        # corp_extract_laws_transformed; across generations the deeper one
+        # wins, so walk them deepest first. Only kept laws are copied.
         laws_population = {}
-        for i in range(population, 0, -1):
-            current_gen_laws = self.corp_extract_laws_transformed(i)
-            for name_gen, law_data in current_gen_laws.items():
+        for generation in range(population, 0, -1):
+            generation_laws = {}
+            for target_name in self._by_depth.get(generation, ()):
+                generation_laws.update(self._cached_laws_for_target(target_name))
+            for name_gen, law_data in generation_laws.items():
                 if name_gen not in laws_population:
-                    laws_population[name_gen] = law_data.copy()
-
-        top_level_laws = self.law_analyser.extract_laws(self.ast)
+                    laws_population[name_gen] = _copy_law(law_data)
 
-        for name_global, law_data in top_level_laws.items():
+        for name_global, law_data in self.law_analyser.laws.items():
             if name_global not in laws_population:
-                laws_population[name_global] = law_data.copy()
+                laws_population[name_global] = _copy_law(law_data)
 
         return laws_population
 
@@ -491,32 +863,82 @@ class ZenithAnalyser:
 
         self.code = code
         self.lexer = Lexer(code)
-        self.tokens = self.lexer.tokenise()
-
         self.validator = Validator()
-        validation_errors = self.validator.validate_tokens(self.tokens)
-        if validation_errors:
-            raise ZenithValidationError(
-                f"Token validation failed: {validation_errors[0]}",
-                validation_type="tokens",
-            )
 
-        self.parser = Parser(self.tokens)
-        self.ast, self.parser_errors = self.parser.parse()
+        key = None
+        cached = None
+        if _frontend_cache_limit:
+            key = hashlib.blake2b(code.encode("utf-8"), digest_size=16).digest()
+            with _frontend_cache_lock:
+                cached = _frontend_cache.get(key)
+                if cached is not None:
+                    _frontend_cache.move_to_end(key)
+        if cached is not None:
+            self.tokens, self.ast, parser_pos = pickle.loads(cached)
+            self.lexer.tokens = self.tokens
+            # Leave the parser where parse() would have left it.
+            self.parser = Parser(self.tokens)
+            self.parser.pos = parser_pos
+            self.parser_errors = []
+        else:
+            self.tokens = self.lexer.tokenise()
+
+            validation_errors = self.validator.validate_tokens(self.tokens)
+            if validation_errors:
+                raise ZenithValidationError(
+                    f"Token validation failed: {validation_errors[0]}",
+                    validation_type="tokens",
+                )
 
-        if self.parser_errors:
-            raise ZenithValidationError(
-                f"Parsing failed: {self.parser_errors[0]}", validation_type="parsing"
-            )
+            self.parser = Parser(self.tokens)
+            self.ast, self.parser_errors = self.parser.parse()
 
-        ast_errors = self.validator.validate_ast(self.ast)
-        if ast_errors:
-            raise ZenithValidationError(
-                f"AST validation failed: {ast_errors[0]}", validation_type="ast"
-            )
+            if self.parser_errors:
+                raise ZenithValidationError(
+                    f"Parsing failed: {self.parser_errors[0]}",
+                    validation_type="parsing",
+                )
+
+            ast_errors = self.validator.validate_ast(self.ast)
+            if ast_errors:
+                raise ZenithValidationError(
+                    f"AST validation failed: {ast_errors[0]}", validation_type="ast"
+                )
+
+            if key is not None:
+                self._store_frontend(key)
 
         self.law_analyser = LawAnalyser(self.ast)
-        self.target_analyser = TargetAnalyser(self.ast)
+        self.target_analyser = TargetAnalyser(
+            self.ast, law_analyser=self.law_analyser
+        )
+        # Law descriptions by (name, population); the AST is fixed, so they
+        # never go stale.
+        self._law_description_cache: Dict[Tuple[str, int], Dict[str, Any]] = {}
+        self._target_description_cache: Dict[str, Dict[str, Any]] = {}
+        self._population_description_cache: Dict[int, Dict[str, Any]] = {}
+
+    def _store_frontend(self, key: bytes) -> None:
+        """
+        Store the validated frontend in the frontend cache.
+
+        Args:
+            key: Digest of the analysed code
+        """
+        global _frontend_cache_bytes
+        entry = pickle.dumps(
+            (self.tokens, self.ast, self.parser.pos),
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        with _frontend_cache_lock:
+            if len(entry) > _frontend_cache_limit:
+                return
+            previous = _frontend_cache.pop(key, None)
+            if previous is not None:
+                _frontend_cache_bytes -= len(previous)
+            _frontend_cache[key] = entry
+            _frontend_cache_bytes += len(entry)
+            _evict_frontend_cache()
 
     def corpus_timezone(
        self,
@@ -535,25 +957,21 @@ class ZenithAnalyser:
         from .lexer import Lexer
         from .parser import Parser
         from .unparser import ASTUnparser
-        import copy
 
         lexer = Lexer(self.code)
         tokens = lexer.tokenise()
         parser = Parser(tokens)
-        ast = parser.parse()[0]
-
-        new_ast = copy.deepcopy(ast)
-
-        def _traverse(elements: List[Dict[str, Any]]) -> None:
-            for element in elements:
-                if element.get("type") == "law":
-                    self._law_timezone(element,local_tz,orginal_tz)
-                elif element.get("type") == "target":
-                    contents = element.get("contents", {})
-                    blocks = contents.get("blocks", [])
-                    _traverse(blocks)
-
-        _traverse(new_ast.get("elements", []))
+        # A fresh parse nothing else references, so it can be shifted in place.
+        new_ast = parser.parse()[0]
+
+        stack = list(reversed(new_ast.get("elements", [])))
+        while stack:
+            element = stack.pop()
+            if element.get("type") == "law":
+                self._law_timezone(element,local_tz,orginal_tz)
+            elif element.get("type") == "target":
+                contents = element.get("contents", {})
+                stack.extend(reversed(contents.get("blocks", [])))
 
         unparser = ASTUnparser(new_ast)
         code = unparser.unparse()
@@ -625,12 +1043,18 @@ class ZenithAnalyser:
         law_name = law_data["name"]
         date = law_data["date"]
         time = law_data["time"]
-        start_date = datetime.strptime(f"{date} {time}", "%Y-%m-%d %H:%M")
-        current_time = start_date
+        start_date = parse_datetime(date, time)
 
         simulated_events = []
         group_m = law_data["group"]
 
+        # Convert all points up front and walk the timeline in plain integer
+        # minutes; datetimes are only built for the returned tuples.
+        offsets = _event_offsets(
+            points_to_minutes(map(_COHERENCE, group_m)),
+            points_to_minutes(map(_DISPERSAL, group_m[:-1])),
+        )
+
         event_descriptions = {
             item["name"]: dict_map.get(
                 item["name"], item.get("description", item["name"])
@@ -638,28 +1062,30 @@ class ZenithAnalyser:
             for item in law_data.get("dictionnary", [])
         }
 
-        for index, event in enumerate(group_m):
+        # Groups repeat the same events, so resolve each name only once.
+        resolved: Dict[str, str] = {}
+        get_resolved = resolved.get
+        append_event = simulated_events.append
 
-            event_id = event["name"]
-            events = event_id.split("|")
-            for i, e in enumerate(events):
-                events[i] = event_descriptions.get(e, e)
+        for event, (start_offset, end_offset) in zip(group_m, offsets):
 
-            event_description = "|".join(reversed(events))
-
-            chronocoherence = point_to_minutes(event["chronocoherence"])
-            end_date_event = current_time + timedelta(minutes=chronocoherence)
-
-            simulated_events.append(
-                (current_time, law_name, event_description, end_date_event)
+            event_id = event["name"]
+            event_description = get_resolved(event_id)
+            if event_description is None:
+                event_description = "|".join(
+                    event_descriptions.get(e, e) for e in reversed(event_id.split("|"))
+                )
+                resolved[event_id] = event_description
+
+            append_event(
+                (
+                    start_date + start_offset * _ONE_MINUTE,
+                    law_name,
+                    event_description,
+                    start_date + end_offset * _ONE_MINUTE,
+                )
             )
 
-            current_time = end_date_event
-
-            if index < len(group_m) - 1:
-                chronodispersal = point_to_minutes(event["chronodispersal"])
-                current_time += timedelta(minutes=chronodispersal)
-
         return simulated_events
 
     def target_description(self, target_name: str) -> Dict[str, Any]:
@@ -669,12 +1095,18 @@ class ZenithAnalyser:
         et retourne le résultat de law_description_data.
         """
 
-        if target_name not in self.target_analyser.targets:
+        cached = self._target_description_cache.get(target_name)
+        if cached is not None:
+            return _copy_description(cached)
+
+        target_analyser = self.target_analyser
+        target = target_analyser.targets.get(target_name)
+        if target is None:
             raise ZenithAnalyserError(
                 f"Target '{target_name}' not found", target_name=target_name
             )
 
-        transformed_laws = self.target_analyser.extract_laws_for_target(target_name)
+        transformed_laws = target_analyser.extract_laws_for_target(target_name)
 
         if not transformed_laws:
             raise ZenithAnalyserError(
@@ -682,20 +1114,23 @@ class ZenithAnalyser:
                 target_name=target_name,
             )
 
-        target_dict = self.target_analyser.targets[target_name].get("dictionnary", [])
+        target_dict = target.get("dictionnary", [])
         merged_dictionnary_map = {
             item["name"]: item["description"] for item in target_dict
         }
 
-        all_simulated_events = []
-
-        for law_name, law_data in transformed_laws.items():
-            simulated_events = self._simulate_law_events(
-                law_data, merged_dictionnary_map
+        # Each law's events come out in chronological order, so a k-way merge
+        # is enough to order them; it is stable like the sort it replaces.
+        simulate = self._simulate_law_events
+        all_simulated_events = list(
+            heapq.merge(
+                *(
+                    simulate(law_data, merged_dictionnary_map)
+                    for law_data in transformed_laws.values()
+                ),
+                key=_EVENT_START,
             )
-            all_simulated_events.extend(simulated_events)
-
-        all_simulated_events.sort(key=lambda x: x[0])
+        )
 
         if not all_simulated_events:
             raise ZenithAnalyserError(
@@ -703,76 +1138,34 @@ class ZenithAnalyser:
                 target_name=target_name,
             )
 
-        time_points = sorted({e[0] for e in all_simulated_events}.union({e[3] for e in all_simulated_events}))
-
-        segments = []
-
-        for i in range(len(time_points) - 1):
-            start = time_points[i]
-            end = time_points[i+1]
-
-            if start >= end:
-                continue
-
-            active = [
-                e[2] for e in all_simulated_events
-                if e[0] <= start and e[3] >= end
-            ]
-            if not active:
-                continue
-
-            title = "|".join(reversed(active))
-
-            segments.append(
-                (start, title, end)
-            )
-
+        segments = _timeline_segments(all_simulated_events)
 
         base_law_name = all_simulated_events[0][1]
         base_law_data = transformed_laws[base_law_name]
-
-        merged_law_data = base_law_data.copy()
-        merged_law_data["name"] = target_name
-
         first_event_start_time = all_simulated_events[0][0]
-        merged_law_data["date"] = first_event_start_time.strftime("%Y-%m-%d")
-        merged_law_data["time"] = first_event_start_time.strftime("%H:%M")
 
-        new_group = []
+        new_group = _segments_group(segments)
 
-        for i, (start_time, event_desc, end_time) in enumerate(segments):
-            coherence_minutes = int((end_time - start_time).total_seconds() / 60)
-
-            dispersal_minutes = 0
-            if i < len(segments) - 1:
-                next_start_time = segments[i + 1][0]
-                dispersal_minutes = int(
-                    (next_start_time - end_time).total_seconds() / 60
-                )
-
-            coherence_str = (
-                minutes_to_point(coherence_minutes) if coherence_minutes > 0 else "0"
-            )
-            dispersal_str = minutes_to_point(max(0, dispersal_minutes))
-
-            new_group.append(
-                {
-                    "name": event_desc,
-                    "chronocoherence": coherence_str,
-                    "chronodispersal": dispersal_str,
-                }
-            )
-
-        merged_law_data["group"] = new_group
-
-        unique_event_names = sorted({event["name"] for event in new_group})
+        # Only used as a name lookup, so timeline order is as good as sorted.
         final_dictionnary = [
-            {"name": name, "description": name} for name in unique_event_names
+            {"name": name, "description": name}
+            for name in dict.fromkeys(event["name"] for event in new_group)
         ]
 
-        merged_law_data["dictionnary"] = final_dictionnary
+        # Only the fields law_description_data reads; the base law's
+        # source_node and entries are not needed.
+        merged_law_data = {
+            "name": target_name,
+            "date": first_event_start_time.strftime("%Y-%m-%d"),
+            "time": first_event_start_time.strftime("%H:%M"),
+            "period": base_law_data.get("period"),
+            "group": new_group,
+            "dictionnary": final_dictionnary,
+        }
 
-        return self.law_description_data(target_name, merged_law_data)
+        description = self.law_description_data(target_name, merged_law_data)
+        self._target_description_cache[target_name] = description
+        return _copy_description(description)
 
 
     def law_description(self, name: str, population: int = 0) -> Dict[str, Any]:
@@ -789,6 +1182,11 @@ class ZenithAnalyser:
         Raises:
             ZenithAnalyserError: If law not found or invalid
         """
+        key = (name, population)
+        cached = self._law_description_cache.get(key)
+        if cached is not None:
+            return _copy_description(cached)
+
         law_data = None
 
         if population > 0:
@@ -797,11 +1195,15 @@ class ZenithAnalyser:
                 law_data = transformed_laws[name]
 
         if not law_data:
-            law_data = self.law_analyser.get_law(name)
-            if not law_data:
+            if name not in self.law_analyser.laws:
                 raise ZenithAnalyserError(f"Law '{name}' not found", law_name=name)
+            # law_description_data rewrites group entries, so copy those only.
+            law_data = _copy_law(self.law_analyser.laws[name])
 
-        return self.law_description_data(name, law_data)
+        description = self.law_description_data(name, law_data)
+        self._law_description_cache[key] = description
+        # Callers may mutate the result, so keep the cached one private.
+        return _copy_description(description)
 
     def law_description_data(
         self, name: str, law_data: Dict[str, Any]
@@ -819,8 +1221,7 @@ class ZenithAnalyser:
         Raises:
             ZenithAnalyserError: If law data is invalid
         """
-        required = ["date", "time", "period", "dictionnary", "group"]
-        for field in required:
+        for field in _LAW_REQUIRED_FIELDS:
             if field not in law_data:
                 raise ZenithAnalyserError(
                     f"Law data missing required field: {field}", law_name=name
@@ -828,30 +1229,30 @@ class ZenithAnalyser:
 
         group = law_data["group"].copy()
 
-        event_descriptions = {}
-        for entry in law_data["dictionnary"]:
-            entry_name = entry.get("name")
-            entry_desc = entry.get("description", "")
-            event_descriptions[entry_name] = entry_desc or entry_name
+        # Entries without a description fall back to their own name.
+        event_descriptions = {
+            entry.get("name"): entry.get("description") or entry.get("name")
+            for entry in law_data["dictionnary"]
+        }
 
+        get_description = event_descriptions.get
         for event in group:
-            event_name = event.get("name", "")
-            events = event_name.split("|")
-            for i, e in enumerate(events):
-                if e in event_descriptions:
-                    events[i] = event_descriptions[e]
-            event["name"]="|".join(events)
-
-        total_coherence = 0
-        total_dispersal = 0
-
-        for i, event in enumerate(group):
-            coherence = point_to_minutes(event["chronocoherence"])
-            total_coherence += coherence
-
-            if i < len(group) - 1:
-                dispersal = point_to_minutes(event["chronodispersal"])
-                total_dispersal += dispersal
+            events = event.get("name", "").split("|")
+            described = [get_description(e, e) for e in events]
+            # Only write back names that actually change.
+            if described != events or "name" not in event:
+                event["name"] = "|".join(described)
+
+        # Convert every point once; the loops below only index these lists.
+        # The last event's dispersal is never part of the timeline.
+        coh = points_to_minutes(map(_COHERENCE, group))
+        disp = points_to_minutes(map(_DISPERSAL, group[:-1]))
+        disp.append(0)
+        # pref[i] is the elapsed time from the first event's start to event i's.
+        pref = list(accumulate(map(add, coh, disp), initial=0))
+
+        total_coherence = sum(coh)
+        total_dispersal = sum(disp)
 
         total_duration = total_coherence + total_dispersal
 
@@ -865,126 +1266,95 @@ class ZenithAnalyser:
         )
 
         simulation = []
+        # Per event name, in first-seen order: an index into parallel
+        # count/coherence/dispersal totals.
+        event_index: Dict[str, int] = {}
+        counts: List[int] = []
+        coherences: List[int] = []
+        dispersals: List[int] = []
+        # Per event name: index of its last occurrence and the running
+        # (total, count) of gaps between consecutive occurrences.
+        last_position = {}
+        dispersion_totals = defaultdict(lambda: [0, 0])
         current_time = start_dt
+        current_str = format_datetime(current_time)
+
+        # Bound once; these run for every event of the group.
+        add_minutes = add_minutes_to_datetime
+        format_dt = format_datetime
+        append_simulation = simulation.append
+        get_index = event_index.get
+        get_last_position = last_position.get
 
         for i, event in enumerate(group):
-            coherence = point_to_minutes(event["chronocoherence"])
-            event_end = add_minutes_to_datetime(current_time, coherence)
+            coherence = coh[i]
+            dispersal = disp[i]
+            event_end = add_minutes(current_time, coherence)
+            event_end_str = format_dt(event_end)
 
-            simulation.append(
+            append_simulation(
                 {
                     "event_name": event["name"],
-                    "start": format_datetime(current_time),
-                    "end": format_datetime(event_end),
-                    "duration_minutes": int(coherence),
+                    "start": current_str,
+                    "end": event_end_str,
+                    "duration_minutes": coherence,
                 }
             )
 
             current_time = event_end
 
-            if i < len(group) - 1:
-                dispersal = point_to_minutes(event["chronodispersal"])
-                current_time = add_minutes_to_datetime(current_time, dispersal)
-
-        segments = simulation
-        segments = sorted(segments, key=lambda e:parse_datetime(e["start"]["date"],e["start"]["time"]))
-
-        event_metrics = {}
-
-        for i in range(len(segments)):
-            s = segments[i]["start"]
-            start = parse_datetime(s["date"], s["time"])
-            en = segments[i]["end"]
-            end = parse_datetime(en["date"], en["time"])
-
-            coherence = calculate_duration(start, end)
-            dispersal = 0
-
-            if i < len(segments) -1:
-                s = segments[i+1]["start"]
-                next_start = parse_datetime(s["date"], s["time"])
-                dispersal = calculate_duration(end, next_start)
+            # Without a dispersal the next event starts where this one ended,
+            # so reuse the formatted strings (in a dict of its own).
+            if dispersal:
+                current_time = add_minutes(current_time, dispersal)
+                current_str = format_dt(current_time)
+            else:
+                current_str = dict(event_end_str)
 
-            events = segments[i]["event_name"].split("|")
+            events = event["name"].split("|")
             for v in events:
                 if v:
-                    if v not in event_metrics:
-                        event_metrics[v]={
-                            "count":0,
-                            "coherence":0,
-                            "dispersal":0
-                        }
-
-                    event_metrics[v]["count"] +=1
-                    event_metrics[v]["coherence"] += coherence
-                    event_metrics[v]["dispersal"] += dispersal
-
-
-        formatted_metrics = []
-        for event_name, metrics in event_metrics.items():
-            count = metrics["count"]
-            formatted_metrics.append(
-                {
-                    "name": event_name,
-                    "count": count,
-                    "coherence": int(metrics["coherence"]),
-                    "dispersal": int(metrics["dispersal"]),
-                    "mean_coherence": int(
-                        metrics["coherence"] / count if count > 0 else 0
-                    ),
-                    "mean_dispersal": int(
-                        metrics["dispersal"] / count if count > 0 else 0
-                    ),
-                }
+                    idx = get_index(v)
+                    if idx is None:
+                        idx = event_index[v] = len(counts)
+                        counts.append(0)
+                        coherences.append(0)
+                        dispersals.append(0)
+
+                    counts[idx] += 1
+                    coherences[idx] += coherence
+                    dispersals[idx] += dispersal
+
+            for v in dict.fromkeys(events):
+                previous = get_last_position(v)
+                if previous is not None:
+                    # Gap between the end of one occurrence and the next start.
+                    totals = dispersion_totals[v]
+                    totals[0] += pref[i] - pref[previous] - coh[previous]
+                    totals[1] += 1
+                last_position[v] = i
+
+        formatted_metrics = [
+            {
+                "name": event_name,
+                "count": count,
+                "coherence": event_coherence,
+                "dispersal": event_dispersal,
+                "mean_coherence": event_coherence // count,
+                "mean_dispersal": event_dispersal // count,
+            }
+            for event_name, count, event_coherence, event_dispersal in zip(
+                event_index, counts, coherences, dispersals
             )
-
-        dispersion_metrics = {}
-        event_positions = {}
-        all_events=set()
-
-        for i, event in enumerate(group):
-            event_name = event["name"]
-            events = event_name.split("|")
-            all_events.update(set(events))
-
-
-        for event in all_events:
-            for i , event_ in enumerate(group):
-                event_name = event_["name"]
-                events = event_name.split("|")
-                if event in events:
-                    event_positions.setdefault(event, []).append(i)
-
-        for event_name, positions in event_positions.items():
-            if len(positions) > 1:
-                dispersions = []
-                for j in range(len(positions) - 1):
-                    start_pos = positions[j]
-                    end_pos = positions[j + 1]
-                    dispersion_time = 0
-                    dispersion_time += point_to_minutes(group[start_pos]["chronodispersal"])
-                    for k in range(start_pos + 1, end_pos):
-                        dispersion_time += point_to_minutes(group[k]["chronocoherence"])
-                        if k < len(group) - 1:
-                            dispersion_time += point_to_minutes(
-                                group[k]["chronodispersal"]
-                            )
-                    dispersions.append(dispersion_time)
-
-                dispersion_metrics[event_name] = {
-                    "mean_dispersion": int(
-                        sum(dispersions) / len(dispersions) if dispersions else 0
-                    ),
-                    "dispersion_count": len(dispersions),
-                }
+        ]
 
         formatted_dispersion = [
             {
                 "name": event_name,
-                "mean_dispersion": int(metrics["mean_dispersion"]),
-                "dispersion_count": metrics["dispersion_count"],
+                "mean_dispersion": total // count,
+                "dispersion_count": count,
             }
-            for event_name, metrics in dispersion_metrics.items()
+            for event_name, (total, count) in dispersion_totals.items()
         ]
 
         period = minutes_to_point(total_duration)
@@ -996,18 +1366,18 @@ class ZenithAnalyser:
 
         mean_coherence = 0
         mean_dispersal = 0
-        last_index = len(group)-1
-        last_invent = group[last_index]["name"]
-        len_last_event = len(last_invent.split("|"))
+        # An empty group has no timeline to average over.
         if len_events > 0:
+            last_invent = group[-1]["name"]
+            len_last_event = len(last_invent.split("|"))
             duration_coherence = 0
             duration_dispersal = 0
             for t in formatted_metrics:
                 duration_coherence += t["coherence"]
                 duration_dispersal += t["dispersal"]
-            mean_coherence = int(duration_coherence / len_events) if len_events > 0 else 0
-            mean_dispersal = int(duration_dispersal / (len_events - len_last_event)) \
-            if len_events > 0 and (len_events - len_last_event) > 0 else 0
+            mean_coherence = duration_coherence // len_events
+            mean_dispersal = duration_dispersal // (len_events - len_last_event) \
+            if (len_events - len_last_event) > 0 else 0
 
 
         return {
@@ -1022,13 +1392,13 @@ class ZenithAnalyser:
             "coherence": total_coherence,
             "dispersal": total_dispersal,
             "event_count": len_events,
-            "unique_event_count": len(event_metrics),
+            "unique_event_count": len(event_index),
             "simulation": simulation,
             "event_metrics": formatted_metrics,
             "dispersion_metrics": formatted_dispersion,
             "mean_coherence": mean_coherence,
             "mean_dispersal":  mean_dispersal,
-            "events": list(event_metrics.keys()),
+            "events": list(event_index),
         }
 
     def population_description(
@@ -1044,32 +1414,34 @@ class ZenithAnalyser:
             Population description
         """
 
+        target_analyser = self.target_analyser
         if population == -1:
-            population = self.target_analyser.get_max_generation()
-            transformed_laws = self.target_analyser.extract_laws_population(population)
-        else:
-            transformed_laws = self.target_analyser.extract_laws_population(population)
-
-        all_simulated_events = []
-
-        for law_name, law_content in \
-        transformed_laws.items():
-            simulated_events = []
-
-            dict_map = {item['name']: item['description'] \
-                        for item in law_content.get('dictionnary', [])}
+            population = target_analyser.get_max_generation()
 
+        cached = self._population_description_cache.get(population)
+        if cached is not None:
+            return _copy_description(cached)
 
-            simulated_events = self._simulate_law_events(law_content, dict_map)
-            all_simulated_events.extend(simulated_events)
+        transformed_laws = target_analyser.extract_laws_population(population)
 
         if not transformed_laws:
              raise ZenithAnalyserError(f"No laws found for population {population}")
 
-        target_name = f"Population_Level_{population}"
+        # Each law's own dictionnary already provides its descriptions, so
+        # there is nothing to merge on top of it. Per-law events are already
+        # in chronological order and only need merging.
+        all_simulated_events = list(
+            heapq.merge(
+                *(
+                    self._simulate_law_events(law_content, {})
+                    for law_content in transformed_laws.values()
+                ),
+                key=_EVENT_START,
+            )
+        )
 
+        target_name = f"Population_Level_{population}"
 
-        all_simulated_events.sort(key=lambda x: x[0])
 
         if not all_simulated_events:
             raise ZenithAnalyserError(
@@ -1077,75 +1449,34 @@ class ZenithAnalyser:
                 target_name=target_name,
             )
 
-        time_points = sorted({e[0] for e in all_simulated_events}.union({e[3] for e in all_simulated_events}))
-
-        segments = []
-
-        for i in range(len(time_points) - 1):
-            start = time_points[i]
-            end = time_points[i+1]
-
-            if start >= end:
-                continue
-
-            active = [
-                e[2] for e in all_simulated_events
-                if e[0] <= start and e[3] >= end
-            ]
-            if not active:
-                continue
-
-            title = "|".join(reversed(active))
-
-            segments.append(
-                (start, title, end)
-            )
+        segments = _timeline_segments(all_simulated_events)
 
         base_law_name = all_simulated_events[0][1]
         base_law_data = transformed_laws[base_law_name]
-
-        merged_law_data = base_law_data.copy()
-        merged_law_data["name"] = target_name
-
         first_event_start_time = all_simulated_events[0][0]
-        merged_law_data["date"] = first_event_start_time.strftime("%Y-%m-%d")
-        merged_law_data["time"] = first_event_start_time.strftime("%H:%M")
 
-        new_group = []
-
-        for i, (start_time, event_desc, end_time) in enumerate(segments):
-            coherence_minutes = int((end_time - start_time).total_seconds() / 60)
-
-            dispersal_minutes = 0
-            if i < len(segments) - 1:
-                next_start_time = segments[i + 1][0]
-                dispersal_minutes = int(
-                    (next_start_time - end_time).total_seconds() / 60
-                )
-
-            coherence_str = (
-                minutes_to_point(coherence_minutes) if coherence_minutes > 0 else "0"
-            )
-            dispersal_str = minutes_to_point(max(0, dispersal_minutes))
-
-            new_group.append(
-                {
-                    "name": event_desc,
-                    "chronocoherence": coherence_str,
-                    "chronodispersal": dispersal_str,
-                }
-            )
+        new_group = _segments_group(segments)
 
-        merged_law_data["group"] = new_group
-
-        unique_event_names = sorted({event["name"] for event in new_group})
+        # Only used as a name lookup, so timeline order is as good as sorted.
         final_dictionnary = [
-            {"name": name, "description": name} for name in unique_event_names
+            {"name": name, "description": name}
+            for name in dict.fromkeys(event["name"] for event in new_group)
         ]
 
-        merged_law_data["dictionnary"] = final_dictionnary
+        # Only the fields law_description_data reads; the base law's
+        # source_node and entries are not needed.
+        merged_law_data = {
+            "name": target_name,
+            "date": first_event_start_time.strftime("%Y-%m-%d"),
+            "time": first_event_start_time.strftime("%H:%M"),
+            "period": base_law_data.get("period"),
+            "group": new_group,
+            "dictionnary": final_dictionnary,
+        }
 
-        return self.law_description_data(target_name, merged_law_data)
+        description = self.law_description_data(target_name, merged_law_data)
+        self._population_description_cache[population] = description
+        return _copy_description(description)
 
     def period_description(
             self,
@@ -1228,6 +1559,23 @@ class ZenithAnalyser:
 
         return description
 
+    # Tokens and AST are fixed once the analyser is built, so everything
+    # derived from them only needs computing once.
+    @cached_property
+    def _token_errors(self) -> List[str]:
+        return self.validator.validate_tokens(self.tokens)
+
+    @cached_property
+    def _ast_errors(self) -> List[str]:
+        return self.validator.validate_ast(self.ast)
+
+    @cached_property
+    def _ast_size(self) -> int:
+        return self.validator._calculate_ast_size(self.ast)
+
+    @cached_property
+    def _token_debug(self) -> str:
+        return self.lexer.debug_tokens()
 
     def analyze_corpus(self) -> Dict[str, Any]:
         """
@@ -1239,14 +1587,28 @@ class ZenithAnalyser:
         ast_summary = self.parser.get_ast_summary(self.ast)
 
         all_laws = {}
-        for law_name in self.law_analyser.get_law_names():
-            try:
-                all_laws[law_name] = self.law_description(law_name)
-            except ZenithAnalyserError as e:
-                all_laws[law_name] = {"error": str(e)}
+        total_events = 0
+        total_duration = 0
+        description_cache = self._law_description_cache
+        for law_name, law_data in self.law_analyser.laws.items():
+            # Same result as law_description(law_name), without looking the
+            # law up again by name.
+            description = description_cache.get((law_name, 0))
+            if description is None:
+                try:
+                    description = self.law_description_data(
+                        law_name, _copy_law(law_data)
+                    )
+                except ZenithAnalyserError as e:
+                    all_laws[law_name] = {"error": str(e)}
+                    continue
+                description_cache[(law_name, 0)] = description
+            all_laws[law_name] = _copy_description(description)
+            total_events += description.get("event_count", 0)
+            total_duration += description.get("sum_duration", 0)
 
         all_targets = {}
-        for target_name in self.target_analyser.get_target_names():
+        for target_name in self.target_analyser.targets:
             try:
                 all_targets[target_name] = self.target_description(
                     target_name
@@ -1254,21 +1616,13 @@ class ZenithAnalyser:
             except ZenithAnalyserError as e:
                 all_targets[target_name] = {"error": str(e)}
 
-        total_events = 0
-        total_duration = 0
-
-        for law_data in all_laws.values():
-            if isinstance(law_data, dict) and "error" not in law_data:
-                total_events += law_data.get("event_count", 0)
-                total_duration += law_data.get("sum_duration", 0)
-
         corpus_stats = {
             "total_laws": len(all_laws),
             "total_targets": len(all_targets),
             "total_events": total_events,
             "sum_duration": total_duration,
             "max_nesting": ast_summary.get("max_nesting", 0),
-            "analysis_timestamp": datetime.now().isoformat(),
+            "analysis_timestamp": _now().isoformat(),
         }
 
         return {
@@ -1277,9 +1631,9 @@ class ZenithAnalyser:
             "laws": all_laws,
             "targets": all_targets,
             "validation": {
-                "lexer": len(self.validator.validate_tokens(self.tokens)) == 0,
-                "parser": len(self.parser_errors) == 0,
-                "ast": len(self.validator.validate_ast(self.ast)) == 0,
+                "lexer": not self._token_errors,
+                "parser": not self.parser_errors,
+                "ast": not self._ast_errors,
             },
         }
 
@@ -1296,8 +1650,18 @@ class ZenithAnalyser:
         analysis = self.analyze_corpus()
 
         try:
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(analysis, f, indent=2, default=str)
+            if orjson is not None:
+                with open(filepath, "wb") as f:
+                    f.write(
+                        orjson.dumps(
+                            analysis,
+                            default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                        )
+                    )
+            else:
+                with open(filepath, "w", encoding="utf-8") as f:
+                    json.dump(analysis, f, indent=2, default=str)
         except (IOError, OSError) as e:
             raise IOError(f"Failed to write JSON file: {str(e)}") from e
 
@@ -1311,10 +1675,10 @@ class ZenithAnalyser:
         return {
             "code_length": len(self.code),
             "token_count": len(self.tokens),
-            "ast_size": self.validator._calculate_ast_size(self.ast),
+            "ast_size": self._ast_size,
             "law_count": len(self.law_analyser.laws),
             "target_count": len(self.target_analyser.targets),
             "parser_errors": self.parser_errors,
-            "lexer_debug": self.lexer.debug_tokens(),
-            "timestamp": datetime.now().isoformat(),
+            "lexer_debug": self._token_debug,
+            "timestamp": _now().isoformat(),
         }
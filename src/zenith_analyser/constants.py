@@ -80,6 +80,8 @@ DATETIME_FORMAT = f"{DATE_FORMAT} {TIME_FORMAT}"
 MAX_NESTING_DEPTH = 100
 MAX_TOKENS = 100000
 MAX_AST_SIZE = 10000
+MAX_CODE_SIZE = 1000000
+MAX_LINE_LENGTH = 1000
 
 VALID_IDENTIFIER_REGEX = r"^[a-zA-Z_][a-zA-Z0-9_]*$"
 VALID_DATE_REGEX = r"^\d{4}-\d{2}-\d{2}$"
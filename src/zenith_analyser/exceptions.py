@@ -108,6 +108,14 @@ class ZenithLimitError(ZenithError):
         self.actual_value = actual_value
         super().__init__(message)
 
+    def __reduce__(self):
+        # __init__ takes the limit fields, not the formatted message in args.
+        return (
+            type(self),
+            (self.limit_type, self.limit_value, self.actual_value),
+            self.__dict__,
+        )
+
 
 class ZenithTimeError(ZenithError):
     """Exception raised for time-related errors."""
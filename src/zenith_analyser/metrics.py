@@ -24,6 +24,25 @@ from .utils import calculate_duration, parse_datetime
 import math
 import statistics
 from collections import Counter
+from itertools import chain
+
+
+def _stdev(values: List[float], mean: float) -> float:
+    """
+    Sample standard deviation around a known mean.
+
+    statistics.stdev computes exactly with fractions; fsum keeps float
+    sums correctly rounded at a fraction of the cost.
+
+    Args:
+        values (List[float]): At least two values
+        mean (float): Mean of values
+
+    Returns:
+        float: Sample standard deviation
+    """
+    return math.sqrt(math.fsum((x - mean) ** 2 for x in values) / (len(values) - 1))
+
 
 class ZenithMetrics(ZenithAnalyser):
     """
@@ -54,11 +73,18 @@ class ZenithMetrics(ZenithAnalyser):
         rank = s[:]
         k = 1
         while k < n:
-            key = lambda i: (rank[i], rank[i + k] if i + k < n else -1)
-            sa.sort(key=key)
+            # Build each round's sort keys once; sort and re-rank index them.
+            keys = list(zip(rank, rank[k:] + [-1] * min(k, n)))
+            sa.sort(key=keys.__getitem__)
             new_rank = [0] * n
-            for i in range(1, n):
-                new_rank[sa[i]] = new_rank[sa[i-1]] + (1 if key(sa[i]) > key(sa[i-1]) else 0)
+            previous = keys[sa[0]]
+            current_rank = 0
+            for pos in sa[1:]:
+                key = keys[pos]
+                if key != previous:
+                    current_rank += 1
+                    previous = key
+                new_rank[pos] = current_rank
             rank = new_rank
             if rank[sa[n-1]] == n - 1: break
             k *= 2
@@ -88,6 +114,28 @@ class ZenithMetrics(ZenithAnalyser):
                 if h > 0: h -= 1
         return lcp
 
+    def _event_intervals(self, simulations: List[Dict[str, Any]]) -> List[int]:
+        """
+        Compute the waiting time between each event and the next one.
+
+        Each boundary is parsed once; the metric helpers share the result.
+
+        Args:
+            simulations (List[Dict[str, Any]]): List of simulation dictionaries
+
+        Returns:
+            List[int]: len(simulations) - 1 intervals in minutes
+        """
+        ends = [
+            parse_datetime(sim["end"]["date"], sim["end"]["time"])
+            for sim in simulations[:-1]
+        ]
+        starts = [
+            parse_datetime(sim["start"]["date"], sim["start"]["time"])
+            for sim in simulations[1:]
+        ]
+        return [calculate_duration(end, start) for end, start in zip(ends, starts)]
+
 
 
     def get_data_simulations(self, simulations: List[Dict[str, Any]]) -> Dict[str, List[Any]]:
@@ -104,29 +152,15 @@ class ZenithMetrics(ZenithAnalyser):
                 - "coherence": Event durations in minutes
                 - "dispersion": Waiting times before next events
         """
-        datas = {
-            "sequence": [],
-            "event": [],
-            "coherence": [],
-            "dispersion": []
+        dispersion = self._event_intervals(simulations)
+        if simulations:
+            dispersion.append(0)
+        return {
+            "sequence": list(range(1, len(simulations) + 1)),
+            "event": [sim["event_name"] for sim in simulations],
+            "coherence": [sim["duration_minutes"] for sim in simulations],
+            "dispersion": dispersion
         }
-        for i in range(len(simulations)):
-            datas["sequence"].append(i + 1)
-            event_name = simulations[i]["event_name"]
-            datas["event"].append(event_name)
-            coherence = simulations[i]["duration_minutes"]
-            datas["coherence"].append(coherence)
-
-            if i < len(simulations) - 1:
-                start = simulations[i]["end"]
-                start_date = parse_datetime(start["date"], start["time"])
-                end = simulations[i + 1]["start"]
-                end_date = parse_datetime(end["date"], end["time"])
-                dispersion = calculate_duration(start_date, end_date)
-                datas["dispersion"].append(dispersion)
-            else:
-                datas["dispersion"].append(0)
-        return datas
 
     def calculate_temporal_statistics(self, simulations: List[Dict[str, Any]]) -> Dict[str, float]:
         """
@@ -147,33 +181,44 @@ class ZenithMetrics(ZenithAnalyser):
                 - "sum_dispersion": Total waiting time
                 - "events_count": Number of events
         """
-        durations = []
-        dispersions = []
-        for i, sim in enumerate(simulations):
-            durations.append(sim["duration_minutes"])
-            if i < len(simulations) - 1:
-                start = sim["end"]
-                start_date = parse_datetime(start["date"], start["time"])
-                end = simulations[i + 1]["start"]
-                end_date = parse_datetime(end["date"], end["time"])
-                dispersions.append(calculate_duration(start_date, end_date))
-            else:
-                dispersions.append(0)
+        return self._temporal_statistics(
+            simulations,
+            self._event_intervals(simulations),
+            self.calculate_event_frequency(simulations),
+        )
 
-        events_dict = self.calculate_event_frequency(simulations)
-        event_counts = 0
-        for event_count in events_dict.values():
-            event_counts += event_count
+    def _temporal_statistics(
+        self,
+        simulations: List[Dict[str, Any]],
+        intervals: List[int],
+        events_dict: Dict[str, int],
+    ) -> Dict[str, float]:
+        """
+        Calculate temporal statistics from precomputed intervals and frequencies.
 
+        Args:
+            simulations (List[Dict[str, Any]]): List of simulation dictionaries
+            intervals (List[int]): Waiting times from _event_intervals
+            events_dict (Dict[str, int]): Event frequencies
+
+        Returns:
+            Dict[str, float]: See calculate_temporal_statistics
+        """
+        durations = [sim["duration_minutes"] for sim in simulations]
+        dispersions = intervals + [0] if simulations else []
+        event_counts = sum(events_dict.values())
+        avg_duration = statistics.fmean(durations) if durations else 0
 
         return {
-            "avg_duration": statistics.mean(durations) if durations else 0,
+            "avg_duration": avg_duration,
             "median_duration": statistics.median(durations) if durations else 0,
             "min_duration": min(durations) if durations else 0,
             "max_duration": max(durations) if durations else 0,
-            "duration_std": statistics.stdev(durations) if len(durations) > 1 else 0,
+            "duration_std": (
+                _stdev(durations, avg_duration) if len(durations) > 1 else 0
+            ),
             "sum_duration": sum(durations),
-            "avg_dispersion": statistics.mean(dispersions) if dispersions else 0,
+            "avg_dispersion": statistics.fmean(dispersions) if dispersions else 0,
             "sum_dispersion": sum(dispersions) if dispersions else 0,
             "events_count": event_counts
         }
@@ -188,11 +233,9 @@ class ZenithMetrics(ZenithAnalyser):
         Returns:
             Dict[str, int]: Dictionary with event names as keys and counts as values
         """
-        event = [sim["event_name"] for sim in simulations]
-        events = []
-        for e in event:
-            events.extend(e.split("|"))
-        return dict(Counter(events))
+        return dict(Counter(chain.from_iterable(
+            sim["event_name"].split("|") for sim in simulations
+        )))
 
     def calculate_sequence_complexity(self, simulations: List[Dict[str, Any]]) -> Dict[str, float]:
         """
@@ -208,19 +251,31 @@ class ZenithMetrics(ZenithAnalyser):
                 - "transition_variety": Variety of event transitions
                 - "unique_transitions_count": Number of unique transitions
         """
-        total_events = len(simulations)
+        names = [sim["event_name"] for sim in simulations]
+        return self._sequence_complexity(names, Counter(names))
+
+    def _sequence_complexity(
+        self, names: List[str], name_counts: Counter
+    ) -> Dict[str, float]:
+        """
+        Calculate sequence complexity from precomputed event names.
+
+        Args:
+            names (List[str]): Event names in simulation order
+            name_counts (Counter): Occurrences of each name
+
+        Returns:
+            Dict[str, float]: See calculate_sequence_complexity
+        """
+        total_events = len(names)
         if total_events < 2:
             return {"complexity_score": 0, "unique_events_ratio": 0, "transition_variety": 0}
 
-        unique_events = len(set(sim["event_name"] for sim in simulations))
+        unique_events = len(name_counts)
         unique_ratio = unique_events / total_events
 
-        transitions = []
-        for i in range(len(simulations) - 1):
-            transition = f"{simulations[i]['event_name']}->{simulations[i+1]['event_name']}"
-            transitions.append(transition)
-
-        unique_transitions = len(set(transitions))
+        # (previous, next) pairs hash without formatting a string per step.
+        unique_transitions = len(set(zip(names, names[1:])))
         max_possible_transitions = min(unique_events**2, total_events - 1)
         transition_variety = unique_transitions / max_possible_transitions if max_possible_transitions > 0 else 0
         complexity_score = (unique_ratio * 0.4 + transition_variety * 0.6) * 100
@@ -274,17 +329,27 @@ class ZenithMetrics(ZenithAnalyser):
                 - "intervals": List of all interval values
         """
         if len(simulations) < 2: return {"rhythm_consistency": 0, "intervals": []}
-        intervals = []
-        for i in range(len(simulations) - 1):
-            end_current = parse_datetime(simulations[i]["end"]["date"], simulations[i]["end"]["time"])
-            start_next = parse_datetime(simulations[i + 1]["start"]["date"], simulations[i + 1]["start"]["time"])
-            intervals.append(calculate_duration(end_current, start_next))
+        return self._rhythm_metrics(self._event_intervals(simulations))
+
+    def _rhythm_metrics(self, intervals: List[int]) -> Dict[str, Any]:
+        """
+        Calculate rhythm metrics from precomputed intervals.
 
-        cv = statistics.stdev(intervals) / statistics.mean(intervals) if statistics.mean(intervals) > 0 else 0
+        Args:
+            intervals (List[int]): Waiting times from _event_intervals
+
+        Returns:
+            Dict[str, Any]: See calculate_rhythm_metrics
+        """
+        if not intervals:
+            return {"rhythm_consistency": 0, "intervals": []}
+        avg_interval = statistics.fmean(intervals)
+        interval_std = _stdev(intervals, avg_interval) if len(intervals) > 1 else 0
+        cv = interval_std / avg_interval if avg_interval > 0 else 0
         return {
             "rhythm_consistency": 1 / (1 + cv),
-            "avg_interval": statistics.mean(intervals) if intervals else 0,
-            "interval_std": statistics.stdev(intervals) if len(intervals) > 1 else 0,
+            "avg_interval": avg_interval,
+            "interval_std": interval_std,
             "intervals": intervals
         }
 
@@ -308,9 +373,31 @@ class ZenithMetrics(ZenithAnalyser):
             return []
 
         events = [sim["event_name"] for sim in simulations]
-        unique_names = sorted(list(set(events)))
+        return self._detect_patterns(events, Counter(events), min_pattern_length)
+
+    def _detect_patterns(
+        self, events: List[str], name_counts: Counter, min_pattern_length: int = 2
+    ) -> List[Dict[str, Any]]:
+        """
+        Detect recurrent patterns from precomputed event names.
+
+        Args:
+            events (List[str]): Event names in simulation order
+            name_counts (Counter): Occurrences of each name
+            min_pattern_length (int): Minimum pattern length to detect
+
+        Returns:
+            List[Dict[str, Any]]: See detect_patterns
+        """
+        if len(events) < min_pattern_length * 2:
+            return []
+
+        unique_names = sorted(name_counts)
+        # Without a repeated event there is no repeated subsequence either.
+        if len(unique_names) == len(events):
+            return []
         name_to_id = {name: i for i, name in enumerate(unique_names)}
-        event_ids = [name_to_id[name] for name in events]
+        event_ids = list(map(name_to_id.__getitem__, events))
 
         event_ids_sentinel = event_ids + [-1]
 
@@ -332,13 +419,13 @@ class ZenithMetrics(ZenithAnalyser):
                 group_sa = sa[start_idx : end_idx + 1]
 
 
-                left_chars = set()
-                for pos in group_sa:
-                    left_chars.add(event_ids_sentinel[pos - 1] if pos > 0 else -2)
+                left_chars = {
+                    event_ids_sentinel[pos - 1] if pos > 0 else -2 for pos in group_sa
+                }
 
                 if len(left_chars) > 1:
                     pattern_ids = event_ids[group_sa[0] : group_sa[0] + current_lcp]
-                    pattern_names = [unique_names[idx] for idx in pattern_ids]
+                    pattern_names = list(map(unique_names.__getitem__, pattern_ids))
 
                     results.append({
                         "pattern": pattern_names,
@@ -361,14 +448,25 @@ class ZenithMetrics(ZenithAnalyser):
         Returns:
             float: Entropy value (bits)
         """
-        events = [sim["event_name"] for sim in simulations]
-        if not events: return 0
-        counter = Counter(events)
-        total = len(events)
+        return self._entropy(Counter(sim["event_name"] for sim in simulations))
+
+    def _entropy(self, name_counts: Counter) -> float:
+        """
+        Calculate Shannon entropy from precomputed name counts.
+
+        Args:
+            name_counts (Counter): Occurrences of each name
+
+        Returns:
+            float: Entropy value (bits)
+        """
+        total = sum(name_counts.values())
+        if not total:
+            return 0
         entropy = 0
-        for count in counter.values():
+        for count in name_counts.values():
             probability = count / total
-            entropy -= probability * (math.log2(probability) if probability > 0 else 0)
+            entropy -= probability * math.log2(probability)
         return entropy
 
     def get_comprehensive_metrics(self, simulations: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -388,14 +486,22 @@ class ZenithMetrics(ZenithAnalyser):
                 - "patterns_detected": Detected patterns
                 - "entropy": Shannon entropy
         """
+        # Boundaries, names and frequencies feed several metrics; derive
+        # them once.
+        intervals = self._event_intervals(simulations)
+        event_frequency = self.calculate_event_frequency(simulations)
+        names = [sim["event_name"] for sim in simulations]
+        name_counts = Counter(names)
         return {
-            "temporal_statistics": self.calculate_temporal_statistics(simulations),
-            "event_frequency": self.calculate_event_frequency(simulations),
-            "sequence_complexity": self.calculate_sequence_complexity(simulations),
+            "temporal_statistics": self._temporal_statistics(
+                simulations, intervals, event_frequency
+            ),
+            "event_frequency": dict(event_frequency),
+            "sequence_complexity": self._sequence_complexity(names, name_counts),
             "temporal_density": self.calculate_temporal_density(simulations),
-            "rhythm_metrics": self.calculate_rhythm_metrics(simulations),
-            "patterns_detected": self.detect_patterns(simulations),
-            "entropy": self.calculate_entropy(simulations)
+            "rhythm_metrics": self._rhythm_metrics(intervals),
+            "patterns_detected": self._detect_patterns(names, name_counts),
+            "entropy": self._entropy(name_counts)
         }
 
     def get_data_period(
@@ -18,7 +18,8 @@ Utility functions for Zenith Analyser.
 
 import re
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
 import math
 from zoneinfo import ZoneInfo
 
@@ -28,6 +29,9 @@ from ics import Calendar, Event
 from .unparser import ASTUnparser
 
 
+# Points and durations come from a small vocabulary but are converted on
+# every simulation, so both conversions are memoized.
+@lru_cache(maxsize=8192)
 def point_to_minutes(point: str) -> int:
     """
     Convert a Zenith point (format Y.M.D.H.M) to minutes.
@@ -90,6 +94,23 @@ def point_to_minutes(point: str) -> int:
     return -total_minutes if is_negative else total_minutes
 
 
+def points_to_minutes(points: Iterable[str]) -> List[int]:
+    """
+    Convert a sequence of Zenith points to minutes.
+
+    Args:
+        points: Points in Zenith format
+
+    Returns:
+        List of minutes, in the same order
+
+    Raises:
+        ZenithTimeError: If any point format is invalid
+    """
+    return list(map(point_to_minutes, points))
+
+
+@lru_cache(maxsize=8192)
 def minutes_to_point(total_minutes: int | float) -> str:
     """
     Convert minutes to a Zenith point (format Y.M.D.H.M).
@@ -151,6 +172,7 @@ def minutes_to_point(total_minutes: int | float) -> str:
     return point
 
 
+@lru_cache(maxsize=8192)
 def parse_datetime(date_str: str, time_str: str) -> datetime:
     """
     Parse date and time strings into a datetime object.
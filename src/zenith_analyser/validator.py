@@ -22,6 +22,8 @@ from typing import Any, Dict, List
 
 from .constants import (
     MAX_AST_SIZE,
+    MAX_CODE_SIZE,
+    MAX_LINE_LENGTH,
     MAX_NESTING_DEPTH,
     MAX_TOKENS,
     ZENITH_KEYWORDS,
@@ -29,12 +31,39 @@ from .constants import (
 from .exceptions import ZenithLimitError
 from .utils import validate_date, validate_identifier, validate_point, validate_time
 
+_INVALID_CHARS_RE = re.compile(r"[^\w\s\-:\.\"\'\[\]\(\)\{\}^,=]")
+_WORD_RE = re.compile(r"\b\w+\b")
+_KEYWORD_USE_RE = {kw: re.compile(rf"\b{kw}\s*[:\(]") for kw in ZENITH_KEYWORDS}
+
 
 class Validator:
     """
     Validator for Zenith code, tokens, and AST.
     """
 
+    RESERVED_WORDS = frozenset(ZENITH_KEYWORDS)
+    VALID_TOKEN_TYPES = RESERVED_WORDS | {
+        "comma",
+        "colon",
+        "pipe",
+        "hyphen",
+        "equals",
+        "carrot",
+        "lparen",
+        "rparen",
+        "lbracket",
+        "rbracket",
+        "date",
+        "time",
+        "dotted_number",
+        "number",
+        "string",
+        "identifier",
+        "newline",
+        "whitespace",
+    }
+    _KEYWORD_PREFIXES = tuple(f"{kw}:" for kw in RESERVED_WORDS)
+
     def __init__(self):
         self.errors = []
         self.warnings = []
@@ -56,7 +85,7 @@ class Validator:
             return self.errors
 
         # Check code length
-        if len(code) > 1000000:  # 1MB limit
+        if len(code) > MAX_CODE_SIZE:
             self.warnings.append(
                 "Code is very large, consider splitting into smaller files"
             )
@@ -64,13 +93,13 @@ class Validator:
         # Check line length
         lines = code.split("\n")
         for i, line in enumerate(lines, 1):
-            if len(line) > 1000:
+            if len(line) > MAX_LINE_LENGTH:
                 self.warnings.append(f"Line {i} is very long ({len(line)} characters)")
 
         # Check for common issues
         self._validate_basic_syntax(code)
-        self._validate_block_structure(code)
-        self._validate_keywords(code)
+        self._validate_block_structure(lines)
+        self._validate_keywords(lines)
 
         return self.errors
 
@@ -171,16 +200,15 @@ class Validator:
             self.errors.append("Unmatched square brackets")
 
         # Check for invalid characters (basic check)
-        invalid_chars = re.findall(r"[^\w\s\-:\.\"\'\[\]\(\)\{\}^,=]", code)
+        invalid_chars = _INVALID_CHARS_RE.findall(code)
         if invalid_chars:
             unique_chars = set(invalid_chars)
             self.warnings.append(
                 f"Potentially invalid characters found: {unique_chars}"
             )
 
-    def _validate_block_structure(self, code: str):
+    def _validate_block_structure(self, lines: List[str]):
         """Validate block structure."""
-        lines = code.split("\n")
         in_law = False
         in_target = False
 
@@ -210,22 +238,20 @@ class Validator:
             # Check for statements outside blocks
             if not in_law and not in_target:
                 if ":" in stripped and not stripped.startswith(("law", "target")):
-                    if not any(stripped.startswith(f"{kw}:") for kw in ZENITH_KEYWORDS):
+                    if not stripped.startswith(self._KEYWORD_PREFIXES):
                         self.errors.append(
                             f"Line {i}: Statement outside law or target block"
                         )
 
-    def _validate_keywords(self, code: str):
+    def _validate_keywords(self, lines: List[str]):
         """Validate keyword usage."""
-        lines = code.split("\n")
-
         for i, line in enumerate(lines, 1):
-            words = re.findall(r"\b\w+\b", line)
+            words = _WORD_RE.findall(line)
             for word in words:
-                if word in ZENITH_KEYWORDS:
+                if word in self.RESERVED_WORDS:
                     # Check if it's used as a keyword
                     #  (should be followed by colon or space+colon)
-                    if not re.search(rf"\b{word}\s*[:\(]", line):
+                    if not _KEYWORD_USE_RE[word].search(line):
                         self.warnings.append(
                             f"Line {i}: Reserved word '{word}' used as identifier"
                         )
@@ -242,28 +268,7 @@ class Validator:
             return
 
         # Validate token type
-        valid_types = [t for t in ZENITH_KEYWORDS] + [
-            "comma",
-            "colon",
-            "pipe",
-            "hyphen",
-            "equals",
-            "carrot",
-            "lparen",
-            "rparen",
-            "lbracket",
-            "rbracket",
-            "date",
-            "time",
-            "dotted_number",
-            "number",
-            "string",
-            "identifier",
-            "newline",
-            "whitespace",
-        ]
-
-        if token["type"] not in valid_types:
+        if token["type"] not in self.VALID_TOKEN_TYPES:
             self.errors.append(f"Token {index}: Invalid token type '{token['type']}'")
 
         # Validate based on type
@@ -2,12 +2,14 @@
 Pytest configuration and fixtures for Zenith Analyser tests.
 """
 
-import os
-import tempfile
+from functools import lru_cache
+from types import MappingProxyType
 
 import pytest
 
 from src.zenith_analyser import (
+    ASTUnparser,
+    LawAnalyser,
     Lexer,
     Parser,
     Validator,
@@ -15,7 +17,7 @@ from src.zenith_analyser import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_code():
     """Sample Zenith code for testing."""
     return """
@@ -37,7 +39,7 @@ end_target
 """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def complex_code():
     """Complex Zenith code with hierarchy."""
     return """
@@ -70,6 +72,67 @@ end_target
 """
 
 
+@lru_cache(maxsize=32)
+def _cached_analyser(code: str) -> ZenithAnalyser:
+    return ZenithAnalyser(code)
+
+
+@pytest.fixture(scope="session")
+def make_analyser():
+    """Shared ZenithAnalyser per source string; treat results as read-only."""
+    return _cached_analyser
+
+
+@lru_cache(maxsize=32)
+def _pipeline(code: str):
+    tokens = tuple(Lexer(code).tokenise())
+    ast, _ = Parser(list(tokens)).parse()
+    return tokens, ast, LawAnalyser(ast).laws
+
+
+@pytest.fixture(scope="session")
+def pipeline_bundle():
+    """Shared (tokens, ast, laws) per source string; treat results as read-only."""
+    return _pipeline
+
+
+@lru_cache(maxsize=8)
+def _roundtrip(code: str):
+    analyser = _cached_analyser(code)
+    unparsed = ASTUnparser(analyser.ast).unparse()
+    return analyser, unparsed, _cached_analyser(unparsed)
+
+
+@pytest.fixture(scope="session")
+def roundtrip():
+    """Shared parse -> unparse -> parse run: (analyser, unparsed, analyser2)."""
+    return _roundtrip
+
+
+@pytest.fixture(scope="session")
+def big_corpus():
+    """Large synthetic corpus, generated once per session.
+
+    200 targets holding one law each, which stays under MAX_AST_SIZE.
+    """
+    law_template = (
+        "    law l{0}:\n"
+        "        start_date:2024-01-01 at 10:00\n"
+        "        period:1.0\n"
+        "        Event:\n"
+        '            A:"test"\n'
+        "        GROUP:(A 1.0^0)\n"
+        "    end_law\n"
+    )
+    return "".join(
+        f'target t{i}:\n    key:"Target {i}"\n'
+        f'    dictionnary:\n        d{i}:"Entry {i}"\n'
+        + law_template.format(i)
+        + "end_target\n"
+        for i in range(200)
+    )
+
+
 @pytest.fixture
 def analyser(sample_code):
     """ZenithAnalyser instance with sample code."""
@@ -82,46 +145,81 @@ def lexer(sample_code):
     return Lexer(sample_code)
 
 
+@pytest.fixture(scope="session")
+def sample_tokens(sample_code):
+    """Tokens of the sample code, lexed once per session; do not mutate."""
+    return tuple(Lexer(sample_code).tokenise())
+
+
+@pytest.fixture(scope="session")
+def sample_ast(sample_tokens):
+    """AST of the sample code, parsed once per session; do not mutate."""
+    ast, _ = Parser(list(sample_tokens)).parse()
+    return ast
+
+
 @pytest.fixture
-def parser(sample_code):
+def parser(sample_tokens):
     """Parser instance with sample code."""
-    lexer = Lexer(sample_code)
-    tokens = lexer.tokenise()
-    return Parser(tokens)
+    # A fresh list per test; the parser only reads the token dicts.
+    return Parser(list(sample_tokens))
+
+
+@pytest.fixture(scope="module")
+def parsed(request):
+    """Lex and parse ``request.param``; returns ``(ast, errors, tokens)``.
+
+    Use with ``@pytest.mark.parametrize("parsed", [code], indirect=True)``.
+    """
+    tokens = Lexer(request.param).tokenise()
+    ast, errors = Parser(list(tokens)).parse()
+    return ast, errors, tokens
 
 
 @pytest.fixture
-def temp_file():
-    """Create a temporary file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".zenith") as f:
-        yield f.name
-    # Cleanup
-    if os.path.exists(f.name):
-        os.unlink(f.name)
+def temp_file(tmp_path):
+    """Path of a temporary .zenith file for testing."""
+    return str(tmp_path / "test.zenith")
 
 
 @pytest.fixture
-def temp_json_file():
-    """Create a temporary JSON file for testing."""
-    with tempfile.NamedTemporaryFile(mode="w", delete=False, suffix=".json") as f:
-        yield f.name
-    # Cleanup
-    if os.path.exists(f.name):
-        os.unlink(f.name)
+def temp_json_file(tmp_path):
+    """Path of a temporary JSON file for testing."""
+    return str(tmp_path / "test.json")
+
+
+@lru_cache(maxsize=1)
+def _cached_validator() -> Validator:
+    return Validator()
 
 
 @pytest.fixture
 def validator():
-    """Validator instance."""
-    return Validator()
+    """Validator instance with empty errors and warnings."""
+    v = _cached_validator()
+    v.errors.clear()
+    v.warnings.clear()
+    return v
 
 
-@pytest.fixture(params=[1, 2, 3])
-def population_level(request):
-    """Parameterized population levels."""
+@pytest.fixture(
+    scope="session",
+    params=[pytest.param(1, id="level1"), pytest.param(2, id="level2")],
+)
+def population_level_id(request):
+    """Parameterized population levels of the complex code."""
     return request.param
 
 
+@pytest.fixture(scope="session")
+def population_setup(complex_code, make_analyser, population_level_id):
+    """Population description of the complex code, built once per level."""
+    analyser = make_analyser(complex_code)
+    return population_level_id, analyser.population_description(
+        population_level_id
+    )
+
+
 # Custom markers
 def pytest_configure(config):
     """Register custom markers."""
@@ -133,14 +231,20 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "security: security tests")
 
 
-# Test data
-SAMPLE_LAWS = [
-    {
-        "name": "simple_law",
-        "date": "2024-01-01",
-        "time": "10:00",
-        "period": "1.0",
-        "events": [{"name": "A", "description": "Event A"}],
-        "group": [{"name": "A", "chronocoherence": "1.0", "chronodispersal": "0"}],
-    }
-]
+# Test data (read-only, shared by every test)
+SAMPLE_LAWS = (
+    MappingProxyType(
+        {
+            "name": "simple_law",
+            "date": "2024-01-01",
+            "time": "10:00",
+            "period": "1.0",
+            "events": (MappingProxyType({"name": "A", "description": "Event A"}),),
+            "group": (
+                MappingProxyType(
+                    {"name": "A", "chronocoherence": "1.0", "chronodispersal": "0"}
+                ),
+            ),
+        }
+    ),
+)
@@ -24,7 +24,10 @@ from src.zenith_analyser import (
     TargetAnalyser,
     ZenithAnalyser,
     ZenithAnalyserError,
+    clear_frontend_cache,
+    set_frontend_cache_limit,
 )
+from src.zenith_analyser import analysers as analysers_module
 
 
 def test_law_analyser_initialization(parser):
@@ -37,14 +40,9 @@ def test_law_analyser_initialization(parser):
     assert len(analyser.laws) > 0
 
 
-def test_extract_laws(sample_code):
+def test_extract_laws(sample_code, pipeline_bundle):
     """Test law extraction."""
-    from src.zenith_analyser import Lexer, Parser
-
-    lexer = Lexer(sample_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast = parser.parse()[0]
+    _, ast, _ = pipeline_bundle(sample_code)
 
     analyser = LawAnalyser(ast)
     laws = analyser.extract_laws(ast)
@@ -98,6 +96,24 @@ def test_get_law(parser):
     assert law is None
 
 
+def test_get_law_view(parser):
+    """Test getting a read-only law view."""
+    ast = parser.parse()[0]
+    analyser = LawAnalyser(ast)
+
+    view = analyser.get_law_view("test_law")
+    assert view["name"] == "test_law"
+    assert view["group"][0]["name"] == "A"
+
+    with pytest.raises(TypeError):
+        view["name"] = "changed"
+    with pytest.raises(TypeError):
+        view["group"][0]["name"] = "changed"
+
+    assert analyser.laws["test_law"]["group"][0]["name"] == "A"
+    assert analyser.get_law_view("non_existent") is None
+
+
 def test_validate_law(parser):
     """Test law validation."""
     ast, _ = parser.parse()
@@ -110,7 +126,7 @@ def test_validate_law(parser):
     analyser.laws["invalid_law"] = {"name": "invalid"}
     errors = analyser.validate_law("invalid_law")
     assert len(errors) > 0
-    assert any("Missing required field" in error for error in errors)
+    assert "Missing required field" in "\n".join(errors)
 
 
 def test_target_analyser_initialization(parser):
@@ -123,14 +139,18 @@ def test_target_analyser_initialization(parser):
     assert isinstance(analyser.targets, dict)
 
 
-def test_extract_targets(complex_code):
-    """Test target extraction."""
-    from src.zenith_analyser import Lexer, Parser
-
-    lexer = Lexer(complex_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
+def test_target_analyser_shared_law_analyser(parser):
+    """Test TargetAnalyser reuses a provided LawAnalyser."""
     ast = parser.parse()[0]
+    law_analyser = LawAnalyser(ast)
+    analyser = TargetAnalyser(ast, law_analyser=law_analyser)
+
+    assert analyser.law_analyser is law_analyser
+
+
+def test_extract_targets(complex_code, pipeline_bundle):
+    """Test target extraction."""
+    _, ast, _ = pipeline_bundle(complex_code)
 
     analyser = TargetAnalyser(ast)
     targets = analyser.targets
@@ -156,14 +176,27 @@ def test_extract_targets(complex_code):
     assert "child_law" in child["direct_laws"]
 
 
-def test_get_target_hierarchy(complex_code):
-    """Test getting target hierarchy."""
-    from src.zenith_analyser import Lexer, Parser
+def test_get_target_view(complex_code, pipeline_bundle):
+    """Test getting a read-only target view."""
+    _, ast, _ = pipeline_bundle(complex_code)
+
+    analyser = TargetAnalyser(ast)
+
+    view = analyser.get_target_view("child")
+    assert view["path"] == ("parent", "child")
+    assert "child_law" in view["all_descendants_laws"]
+
+    with pytest.raises(TypeError):
+        view["key"] = "changed"
+    with pytest.raises(AttributeError):
+        view["direct_laws"].append("other")
+
+    assert analyser.get_target_view("non_existent") is None
 
-    lexer = Lexer(complex_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast = parser.parse()[0]
+
+def test_get_target_hierarchy(complex_code, pipeline_bundle):
+    """Test getting target hierarchy."""
+    _, ast, _ = pipeline_bundle(complex_code)
 
     analyser = TargetAnalyser(ast)
 
@@ -184,14 +217,9 @@ def test_get_target_hierarchy(complex_code):
     assert "child_law" in hierarchy["direct_laws"]
 
 
-def test_extract_laws_for_target(complex_code):
+def test_extract_laws_for_target(complex_code, pipeline_bundle):
     """Test extracting laws for target with inheritance."""
-    from src.zenith_analyser import Lexer, Parser
-
-    lexer = Lexer(complex_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast = parser.parse()[0]
+    _, ast, _ = pipeline_bundle(complex_code)
 
     analyser = TargetAnalyser(ast)
 
@@ -210,14 +238,23 @@ def test_extract_laws_for_target(complex_code):
     assert dictionnary[0]["description"] == "Derived_event"
 
 
-def test_get_targets_by_generation(complex_code):
-    """Test getting targets by generation."""
-    from src.zenith_analyser import Lexer, Parser
+def test_extract_laws_for_target_cached_copies(complex_code, pipeline_bundle):
+    """Test that repeated extraction returns equal but independent results."""
+    _, ast, _ = pipeline_bundle(complex_code)
 
-    lexer = Lexer(complex_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast = parser.parse()[0]
+    analyser = TargetAnalyser(ast)
+
+    first = analyser.extract_laws_for_target("child")
+    first["child_law"]["dictionnary"][0]["description"] = "mutated"
+
+    second = analyser.extract_laws_for_target("child")
+    assert second["child_law"]["dictionnary"][0]["description"] == "Derived_event"
+    assert second is not first
+
+
+def test_get_targets_by_generation(complex_code, pipeline_bundle):
+    """Test getting targets by generation."""
+    _, ast, _ = pipeline_bundle(complex_code)
 
     analyser = TargetAnalyser(ast)
 
@@ -236,14 +273,9 @@ def test_get_targets_by_generation(complex_code):
     assert len(gen3) == 0
 
 
-def test_get_max_generation(complex_code):
+def test_get_max_generation(complex_code, pipeline_bundle):
     """Test getting maximum generation."""
-    from src.zenith_analyser import Lexer, Parser
-
-    lexer = Lexer(complex_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast, _ = parser.parse()
+    _, ast, _ = pipeline_bundle(complex_code)
 
     analyser = TargetAnalyser(ast)
 
@@ -251,14 +283,9 @@ def test_get_max_generation(complex_code):
     assert max_gen == 2
 
 
-def test_get_targets_by_key(complex_code):
+def test_get_targets_by_key(complex_code, pipeline_bundle):
     """Test getting targets by key."""
-    from src.zenith_analyser import Lexer, Parser
-
-    lexer = Lexer(complex_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast, _ = parser.parse()
+    _, ast, _ = pipeline_bundle(complex_code)
 
     analyser = TargetAnalyser(ast)
 
@@ -282,6 +309,77 @@ def test_zenith_analyser_initialization(sample_code):
     assert isinstance(analyser.target_analyser, TargetAnalyser)
 
 
+@pytest.fixture
+def frontend_cache():
+    """Enable the frontend cache for one test, starting empty."""
+    previous = set_frontend_cache_limit(1 << 20)
+    clear_frontend_cache()
+    yield analysers_module._frontend_cache
+    set_frontend_cache_limit(previous)
+    clear_frontend_cache()
+
+
+def test_frontend_cache_is_opt_in(sample_code):
+    """Test that analysers fill the frontend cache only once it is enabled."""
+    clear_frontend_cache()
+    ZenithAnalyser(sample_code)
+    assert not analysers_module._frontend_cache
+
+    with pytest.raises(ValueError):
+        set_frontend_cache_limit(-1)
+
+
+def test_frontend_cache_hit_matches_miss(sample_code, frontend_cache):
+    """Test that a cache hit builds the same analyser state as a miss."""
+    miss = ZenithAnalyser(sample_code)
+    assert len(frontend_cache) == 1
+    hit = ZenithAnalyser(sample_code)
+
+    assert hit.tokens == miss.tokens
+    assert hit.ast == miss.ast
+    assert hit.parser.pos == miss.parser.pos
+    assert hit.parser_errors == miss.parser_errors == []
+    assert hit.law_description("test_law") == miss.law_description("test_law")
+
+    clear_frontend_cache()
+    assert not frontend_cache
+
+
+def test_frontend_cache_byte_limit(sample_code, complex_code, frontend_cache):
+    """Test that the frontend cache evicts old entries to fit its byte limit."""
+    ZenithAnalyser(sample_code)
+    entry_size = len(next(iter(frontend_cache.values())))
+
+    set_frontend_cache_limit(entry_size)
+    ZenithAnalyser(complex_code)
+    assert len(frontend_cache) <= 1
+    assert sum(map(len, frontend_cache.values())) <= entry_size
+
+    set_frontend_cache_limit(0)
+    assert not frontend_cache
+
+
+def test_zenith_analysers_of_same_code_are_isolated(sample_code, frontend_cache):
+    """Test that mutating one analyser leaves another of the same code intact."""
+    first = ZenithAnalyser(sample_code)
+    second = ZenithAnalyser(sample_code)
+    assert second.ast is not first.ast
+    assert second.tokens is not first.tokens
+
+    first.ast["elements"].clear()
+    first.tokens.clear()
+    first.law_analyser.laws["test_law"].clear()
+    first.law_analyser.laws["test_law"]["group"] = []
+
+    third = ZenithAnalyser(sample_code)
+    for analyser in (second, third):
+        assert len(analyser.ast["elements"]) == 1
+        assert analyser.tokens
+        law = analyser.law_analyser.laws["test_law"]
+        assert law["name"] == "test_law"
+        assert len(law["group"]) == 2
+
+
 def test_law_description(sample_code):
     """Test law description generation."""
     analyser = ZenithAnalyser(sample_code)
@@ -311,6 +409,40 @@ def test_law_description(sample_code):
     assert "coherence" in metrics[0]
 
 
+def test_law_description_cached_copies(sample_code):
+    """Test that repeated law descriptions are equal but independent."""
+    analyser = ZenithAnalyser(sample_code)
+
+    first = analyser.law_description("test_law")
+    first["simulation"][0]["start"]["time"] = "00:00"
+    first["events"].append("extra")
+
+    second = analyser.law_description("test_law")
+    assert second["simulation"][0]["start"]["time"] == "10:00"
+    assert "extra" not in second["events"]
+
+
+def test_law_description_empty_group():
+    """Test law description for a law without events."""
+    code = """law empty_law:
+    start_date:2024-01-01 at 10:00
+    period:1.0
+    Event:
+        A:"First_event"
+    GROUP:()
+end_law
+"""
+    analyser = ZenithAnalyser(code)
+
+    description = analyser.law_description("empty_law")
+
+    assert description["event_count"] == 0
+    assert description["simulation"] == []
+    assert description["event_metrics"] == []
+    assert description["mean_coherence"] == 0
+    assert description["mean_dispersal"] == 0
+
+
 def test_law_description_nonexistent(sample_code):
     """Test law description for non-existent law."""
     analyser = ZenithAnalyser(sample_code)
@@ -336,6 +468,18 @@ def test_target_description(sample_code):
     simulation = description["simulation"]
     assert len(simulation) >= 2
 
+
+def test_target_description_cached_copies(sample_code):
+    """Test that repeated target descriptions are equal but independent."""
+    analyser = ZenithAnalyser(sample_code)
+
+    first = analyser.target_description("test_target")
+    first["simulation"].clear()
+
+    second = analyser.target_description("test_target")
+    assert len(second["simulation"]) >= 2
+    assert second == analyser.target_description("test_target")
+
 def test_population_description(sample_code):
     """Test target description generation."""
     analyser = ZenithAnalyser(sample_code)
@@ -352,6 +496,41 @@ def test_population_description(sample_code):
     assert len(simulation) >= 2
 
 
+def test_population_duplicate_law_names():
+    """Test law name clashes: the last target wins within a generation."""
+    target_template = """
+target {0}:
+    key:"{0}"
+    dictionnary:
+        d:"{1}"
+    law x:
+        start_date:2024-01-01 at 10:00
+        period:1.0
+        Event:
+            A[d]:"Event A"
+        GROUP:(A 1.0^0)
+    end_law
+end_target
+"""
+    code = target_template.format("a", "Alpha") + target_template.format("b", "Beta")
+    analyser = ZenithAnalyser(code)
+
+    laws = analyser.target_analyser.extract_laws_population(1)
+    assert laws["x"]["dictionnary"][0]["description"] == "Beta"
+    assert laws["x"] == analyser.target_analyser.corp_extract_laws_transformed(1)["x"]
+
+    simulation = analyser.population_description(1)["simulation"]
+    assert [event["event_name"] for event in simulation] == ["Beta"]
+
+
+def test_population_description_levels(population_setup):
+    """Test population descriptions for each level of the hierarchy."""
+    level, description = population_setup
+
+    assert description["name"] == f"Population_Level_{level}"
+    assert len(description["simulation"]) >= 2
+
+
 def test_analyze_corpus(sample_code):
     """Test complete corpus analysis."""
     analyser = ZenithAnalyser(sample_code)
@@ -377,6 +556,17 @@ def test_analyze_corpus(sample_code):
     assert all(v is True for v in validation.values())
 
 
+@pytest.mark.benchmark
+def test_analyze_large_corpus(big_corpus):
+    """Test corpus analysis on a large input."""
+    analysis = ZenithAnalyser(big_corpus).analyze_corpus()
+
+    stats = analysis["corpus_statistics"]
+    assert stats["total_laws"] == 200
+    assert stats["total_targets"] == 200
+    assert stats["total_events"] == 200
+
+
 def test_export_json(sample_code, temp_json_file):
     """Test JSON export."""
     analyser = ZenithAnalyser(sample_code)
@@ -409,7 +599,11 @@ def test_get_debug_info(sample_code):
 
 def test_point_conversion_utilities():
     """Test point conversion utilities."""
-    from src.zenith_analyser.utils import minutes_to_point, point_to_minutes
+    from src.zenith_analyser.utils import (
+        minutes_to_point,
+        point_to_minutes,
+        points_to_minutes,
+    )
 
     # Test point_to_minutes
     test_cases = [
@@ -428,6 +622,10 @@ def test_point_conversion_utilities():
             f"Failed for {point}: got {result}, expected {expected}"
         )
 
+    # Test points_to_minutes (batch)
+    points = [point for point, _ in test_cases]
+    assert points_to_minutes(points) == [expected for _, expected in test_cases]
+
     # Test minutes_to_point (round trip)
     test_minutes = [60, 90, 1440, 1500, 43200, 525600]
 
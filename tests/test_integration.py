@@ -18,6 +18,7 @@ Integration tests for Zenith Analyser.
 
 import json
 import os
+import pickle
 import tempfile
 import time
 import tracemalloc
@@ -25,6 +26,14 @@ import tracemalloc
 import pytest
 
 from src.zenith_analyser import ASTUnparser, Validator, ZenithAnalyser
+from src.zenith_analyser.exceptions import (
+    ZenithAnalyserError,
+    ZenithLexerError,
+    ZenithLimitError,
+    ZenithParserError,
+    ZenithTimeError,
+    ZenithValidationError,
+)
 
 
 @pytest.mark.integration
@@ -295,6 +304,7 @@ end_target
     assert events1 == events2
 
 
+@pytest.mark.slow
 @pytest.mark.integration
 def test_memory_usage():
     """Test memory usage doesn't explode."""
@@ -342,3 +352,34 @@ def test_memory_usage():
 
     finally:
         tracemalloc.stop()
+
+
+@pytest.mark.parametrize(
+    "error,fields",
+    [
+        (ZenithLexerError("bad", line=3, column=7), {"line": 3, "column": 7}),
+        (
+            ZenithParserError("bad", token={"line": 2, "col": 4, "value": "x"}),
+            {"token": {"line": 2, "col": 4, "value": "x"}},
+        ),
+        (
+            ZenithAnalyserError("bad", law_name="l", target_name="t"),
+            {"law_name": "l", "target_name": "t"},
+        ),
+        (ZenithValidationError("bad", "ast"), {"validation_type": "ast"}),
+        (
+            ZenithLimitError("AST size", 10, 12),
+            {"limit_type": "AST size", "limit_value": 10, "actual_value": 12},
+        ),
+        (ZenithTimeError("bad", time_value="25:00"), {"time_value": "25:00"}),
+    ],
+)
+def test_errors_survive_pickling(error, fields):
+    """Test that errors keep their fields across processes."""
+    restored = pickle.loads(pickle.dumps(error))
+
+    assert type(restored) is type(error)
+    assert str(restored) == str(error)
+    assert restored.message == error.message
+    for name, value in fields.items():
+        assert getattr(restored, name) == value
@@ -82,6 +82,11 @@ class TestZenithMetrics:
         main_pattern = next(p for p in patterns if p['pattern'] == ['A', 'B', 'C'])
         assert len(main_pattern['occurrences']) == 2
 
+    def test_detect_patterns_distinct_events(self, metrics_instance):
+        """Vérifie qu'une séquence sans répétition ne produit aucun motif."""
+        sims = [{"event_name": name} for name in "ABCDEF"]
+        assert metrics_instance.detect_patterns(sims, min_pattern_length=2) == []
+
     def test_calculate_sequence_complexity(self, metrics_instance, mock_simulations):
         """Vérifie l'indice de complexité (0-100)."""
         complexity = metrics_instance.calculate_sequence_complexity(mock_simulations)
@@ -94,6 +99,15 @@ class TestZenithMetrics:
         assert "rhythm_consistency" in rhythm
         assert isinstance(rhythm["intervals"], list)
 
+    def test_calculate_rhythm_metrics_single_interval(
+        self, metrics_instance, mock_simulations
+    ):
+        """Vérifie qu'un seul intervalle ne lève pas d'erreur."""
+        rhythm = metrics_instance.calculate_rhythm_metrics(mock_simulations[:2])
+        assert rhythm["intervals"] == [5]
+        assert rhythm["interval_std"] == 0
+        assert rhythm["rhythm_consistency"] == 1.0
+
     def test_get_comprehensive_metrics(self, metrics_instance, mock_simulations):
         """Vérifie que le rapport global contient toutes les sections."""
         report = metrics_instance.get_comprehensive_metrics(mock_simulations)
@@ -18,7 +18,7 @@ Tests for the Parser class.
 
 import pytest
 
-from src.zenith_analyser import Parser
+from src.zenith_analyser import Lexer, Parser
 
 
 def test_parser_initialization(sample_code, lexer):
@@ -47,36 +47,47 @@ def test_parse_basic(sample_code, parser):
     assert elements[0]["name"] == "test_target"
 
 
-def test_parse_empty():
+@pytest.mark.parametrize("parsed", [""], indirect=True)
+def test_parse_empty(parsed):
     """Test parsing empty input."""
-    from src.zenith_analyser import Lexer
-
-    lexer = Lexer("")
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-
-    ast, errors = parser.parse()
+    ast, errors, _ = parsed
 
     assert ast["type"] == "corpus_textuel"
     assert ast["elements"] == []
     assert len(errors) == 0
 
 
-def test_parse_invalid_syntax():
+@pytest.mark.parametrize(
+    "parsed", ["target test: law missing_colon"], indirect=True
+)
+def test_parse_invalid_syntax(parsed):
     """Test parsing invalid syntax."""
-    from src.zenith_analyser import Lexer
-
-    code = "target test: law missing_colon"
-    lexer = Lexer(code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-
-    ast, errors = parser.parse()
+    _, errors, _ = parsed
 
     assert len(errors) > 0
     assert "Expected" in errors[0] or "Parsing error" in errors[0]
 
 
+@pytest.mark.parametrize(
+    "code,expected_error",
+    [
+        ("law test:", "Expected start_date"),
+        ("law test:\n    start_date:2024-01-01 at 10:00\nend_law", "Expected period"),
+        (
+            "law test:\n    start_date:2024-01-01 at 10:00\n    period:1.0\nend_law",
+            "Expected Event",
+        ),
+        ("target test:\nend_target", "Expected key"),
+    ],
+)
+def test_parse_missing_required(code, expected_error):
+    """Test parsing blocks with a missing required field."""
+    ast, errors = Parser(Lexer(code).tokenise()).parse()
+
+    assert errors
+    assert expected_error in errors[0]
+
+
 def test_parse_law_structure(sample_code, parser):
     """Test parsing of law structure."""
     ast, errors = parser.parse()
@@ -132,8 +143,6 @@ def test_parse_target_structure(sample_code, parser):
 
 def test_parse_complex_hierarchy(complex_code):
     """Test parsing of complex hierarchy."""
-    from src.zenith_analyser import Lexer
-
     lexer = Lexer(complex_code)
     tokens = lexer.tokenise()
     parser = Parser(tokens)
@@ -179,31 +188,16 @@ def test_get_ast_summary(parser):
     assert summary["events_by_law"]["test_law"] == 2
 
 
+@pytest.mark.slow
 @pytest.mark.integration
-def test_parse_round_trip(sample_code):
+def test_parse_round_trip(sample_code, roundtrip):
     """Test parse -> unparse round trip."""
-    from src.zenith_analyser import ASTUnparser, Lexer, Parser
-
-    # Parse
-    lexer = Lexer(sample_code)
-    tokens = lexer.tokenise()
-    parser = Parser(tokens)
-    ast, errors = parser.parse()
-
-    assert len(errors) == 0
-
-    # Unparse
-    unparser = ASTUnparser(ast)
-    unparsed = unparser.unparse()
-
-    # Parse again
-    lexer2 = Lexer(unparsed)
-    tokens2 = lexer2.tokenise()
-    parser2 = Parser(tokens2)
-    ast2, errors2 = parser2.parse()
+    analyser, _, analyser2 = roundtrip(sample_code)
 
-    assert len(errors2) == 0
+    assert len(analyser.parser_errors) == 0
+    assert len(analyser2.parser_errors) == 0
 
     # Basic structure should match
+    ast, ast2 = analyser.ast, analyser2.ast
     assert ast["type"] == ast2["type"]
     assert len(ast["elements"]) == len(ast2["elements"])
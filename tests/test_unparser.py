@@ -21,6 +21,14 @@ import pytest
 from src.zenith_analyser import ASTUnparser, ZenithAnalyser,format_code
 
 
+@pytest.fixture(scope="module")
+def sample_unparsed(sample_code, make_analyser):
+    """Analyser, unparser and unparsed code for the sample; read-only."""
+    analyser = make_analyser(sample_code)
+    unparser = ASTUnparser(analyser.ast)
+    return analyser, unparser, unparser.unparse()
+
+
 def test_unparser_initialization(parser):
     """Test ASTUnparser initialization."""
     ast = parser.parse()[0]
@@ -31,11 +39,9 @@ def test_unparser_initialization(parser):
     assert unparser.current_indent == 0
 
 
-def test_unparse_basic(sample_code):
+def test_unparse_basic(sample_unparsed):
     """Test basic unparsing."""
-    analyser = ZenithAnalyser(sample_code)
-    unparser = ASTUnparser(analyser.ast)
-    unparsed = unparser.unparse()
+    _, _, unparsed = sample_unparsed
 
     assert isinstance(unparsed, str)
     assert len(unparsed) > 0
@@ -49,20 +55,18 @@ def test_unparse_basic(sample_code):
     assert "end_target" in unparsed
 
 
-def test_unparse_complex(complex_code):
+def test_unparse_complex(complex_code, make_analyser):
     """Test unparsing complex hierarchy."""
-    analyser = ZenithAnalyser(complex_code)
+    analyser = make_analyser(complex_code)
     unparser = ASTUnparser(analyser.ast)
     unparsed = unparser.unparse()
 
-    # Check structure
-    lines = unparsed.split("\n")
-
     # Count indentation levels
     indent_levels = []
-    for line in lines:
-        if line.strip():
-            indent = len(line) - len(line.lstrip())
+    for line in unparsed.splitlines():
+        stripped = line.lstrip()
+        if stripped:
+            indent = len(line) - len(stripped)
             indent_levels.append(indent // 4)  # 4 spaces per indent
 
     # Should have multiple indent levels
@@ -109,19 +113,17 @@ end_target"""
     assert "end_target" in formatted
 
 
-def test_validate_unparse(sample_code):
+def test_validate_unparse(sample_unparsed):
     """Test unparse validation."""
-    analyser = ZenithAnalyser(sample_code)
-    unparser = ASTUnparser(analyser.ast)
+    _, unparser, _ = sample_unparsed
     is_valid = unparser.validate_unparse()
 
     assert is_valid is True
 
 
-def test_get_unparse_stats(sample_code):
+def test_get_unparse_stats(sample_unparsed):
     """Test getting unparse statistics."""
-    analyser = ZenithAnalyser(sample_code)
-    unparser = ASTUnparser(analyser.ast)
+    _, unparser, _ = sample_unparsed
     stats = unparser.get_unparse_stats()
 
     assert isinstance(stats, dict)
@@ -138,16 +140,9 @@ def test_get_unparse_stats(sample_code):
     assert stats["valid_structure"] is True
 
 
-def test_unparse_round_trip(sample_code):
+def test_unparse_round_trip(sample_code, roundtrip):
     """Test unparse -> parse round trip."""
-    analyser = ZenithAnalyser(sample_code)
-
-    # Unparse
-    unparser = ASTUnparser(analyser.ast)
-    unparsed = unparser.unparse()
-
-    # Parse again
-    analyser2 = ZenithAnalyser(unparsed)
+    analyser, _, analyser2 = roundtrip(sample_code)
 
     # Basic checks
     law_names = analyser2.law_analyser.get_law_names()
@@ -212,16 +207,16 @@ end_target
     unparsed = unparser.unparse()
 
     # Check indentation
-    lines = unparsed.split("\n")
-    for line in lines:
-        if line.strip():
-            # Indentation should be multiple of 4
-            indent = len(line) - len(line.lstrip())
-            error_msg = f"Invalid indentation in line: {line}"
-            assert indent % 4 == 0, error_msg
+    for line in unparsed.splitlines():
+        stripped = line.lstrip()
+        if not stripped:
+            continue
+        # Indentation should be multiple of 4
+        indent = len(line) - len(stripped)
+        assert indent % 4 == 0, f"Invalid indentation in line: {line}"
 
 
-def test_event_description_preservation():
+def test_event_description_preservation(make_analyser):
     """Test that event descriptions are preserved in unparsing."""
     code = """
 target test:
@@ -240,7 +235,7 @@ target test:
 end_target
 """
 
-    analyser = ZenithAnalyser(code)
+    analyser = make_analyser(code)
     unparser = ASTUnparser(analyser.ast)
     unparsed = unparser.unparse()
 
@@ -251,7 +246,7 @@ end_target
     assert '"Another description"' in unparsed
 
 
-def test_group_structure_preservation():
+def test_group_structure_preservation(make_analyser):
     """Test that GROUP structure is preserved in unparsing."""
     code = """
 law test:
@@ -265,7 +260,7 @@ law test:
 end_law
 """
 
-    analyser = ZenithAnalyser(code)
+    analyser = make_analyser(code)
     unparser = ASTUnparser(analyser.ast)
     unparsed = unparser.unparse()
 
@@ -281,8 +276,9 @@ end_law
     assert " - " in group_line  # Separators
 
 
+@pytest.mark.slow
 @pytest.mark.integration
-def test_complete_unparse_integration():
+def test_complete_unparse_integration(make_analyser):
     """Test complete unparse integration with formatting."""
     # Create complex code
     code = """
@@ -316,7 +312,7 @@ target project:
 end_target
 """
 
-    analyser = ZenithAnalyser(code)
+    analyser = make_analyser(code)
     unparser = ASTUnparser(analyser.ast)
 
     # Test regular unparse
@@ -330,7 +326,7 @@ end_target
     formatted = format_code(unparsed)
 
     # Parse formatted code to ensure it's valid
-    analyser2 = ZenithAnalyser(formatted)
+    analyser2 = make_analyser(formatted)
     error_count = len(analyser2.parser_errors)
     assert error_count == 0, f"Found {error_count} parser errors"
 
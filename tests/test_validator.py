@@ -16,7 +16,30 @@
 Tests for the Validator class.
 """
 
-from src.zenith_analyser import Validator, ZenithAnalyser
+import re
+from functools import lru_cache
+from types import MappingProxyType
+
+import pytest
+
+from src.zenith_analyser import Validator
+from src.zenith_analyser import validator as validator_module
+
+_INVALID_TOKENS = (
+    MappingProxyType({"type": "invalid_type", "value": "test", "line": 1, "col": 1}),
+)
+_INVALID_AST = MappingProxyType({"type": "invalid_type"})
+
+
+@lru_cache(maxsize=None)
+def _pattern(needle):
+    return re.compile(re.escape(needle), re.IGNORECASE)
+
+
+def _has(messages, needle):
+    """Whether any message contains needle, ignoring case."""
+    # Needles never span lines, so one scan of the joined text suffices.
+    return _pattern(needle).search("\n".join(messages)) is not None
 
 
 def test_validator_initialization():
@@ -27,216 +50,171 @@ def test_validator_initialization():
     assert validator.warnings == []
 
 
-def test_validate_code_basic(sample_code):
+def test_validate_code_basic(sample_code, validator):
     """Test basic code validation."""
-    validator = Validator()
     errors = validator.validate_code(sample_code)
 
     assert len(errors) == 0
     # #assert len(validator.warnings) == 0
 
 
-def test_validate_code_empty():
-    """Test validation of empty code."""
-    validator = Validator()
-    errors = validator.validate_code("")
-
-    assert len(errors) == 1
-    assert "empty" in errors[0].lower()
-
-
-def test_validate_code_unmatched_quotes():
-    """Test validation with unmatched quotes."""
-    code = 'key:"unmatched quote'
-    validator = Validator()
-    errors = validator.validate_code(code)
-
-    assert len(errors) > 0
-    assert "quote" in errors[0].lower()
+VALIDATE_CODE_CASES = [
+    pytest.param("", "empty", "errors", id="empty"),
+    pytest.param('key:"unmatched quote', "quote", "errors", id="unmatched-quotes"),
+    pytest.param("GROUP:(A 1.0^0", "parenthes", "errors", id="unmatched-parentheses"),
+    pytest.param('A[x:"y"', "square bracket", "errors", id="unmatched-brackets"),
+    pytest.param('foo:"bar"', "outside law or target", "errors", id="outside-block"),
+    pytest.param(
+        'target t:\n  key:"x"\nend_target', "indentation", "warnings", id="indent"
+    ),
+    pytest.param(
+        'target t:\n    key:"x";\nend_target',
+        "invalid characters",
+        "warnings",
+        id="invalid-characters",
+    ),
+]
 
 
-def test_validate_code_unmatched_parentheses():
-    """Test validation with unmatched parentheses."""
-    code = "GROUP:(A 1.0^0"
-    validator = Validator()
-    errors = validator.validate_code(code)
+@pytest.mark.parametrize("code,substr,bucket", VALIDATE_CODE_CASES)
+def test_validate_code_issues(validator, code, substr, bucket):
+    """Test that validate_code reports each issue in the expected bucket."""
+    validator.validate_code(code)
 
-    assert len(errors) > 0
-    assert "parenthes" in errors[0].lower()
+    assert _has(getattr(validator, bucket), substr)
 
 
-def test_validate_tokens(sample_code):
+def test_validate_tokens(sample_tokens, validator):
     """Test token validation."""
-    from src.zenith_analyser import Lexer
-
-    lexer = Lexer(sample_code)
-    tokens = lexer.tokenise()
-
-    validator = Validator()
-    errors = validator.validate_tokens(tokens)
+    errors = validator.validate_tokens(sample_tokens)
 
     assert len(errors) == 0
 
 
-def test_validate_tokens_invalid():
+def test_validate_tokens_invalid(validator):
     """Test validation of invalid tokens."""
-    # Create invalid token
-    tokens = [{"type": "invalid_type", "value": "test", "line": 1, "col": 1}]
-
-    validator = Validator()
-    errors = validator.validate_tokens(tokens)
+    errors = validator.validate_tokens(_INVALID_TOKENS)
 
     assert len(errors) > 0
-    assert "invalid token type" in errors[0].lower()
+    assert _has(errors[:1], "invalid token type")
 
 
-def test_validate_ast(sample_code):
-    """Test AST validation."""
-    analyser = ZenithAnalyser(sample_code)
+def test_validate_tokens_large_stream(validator):
+    """Test token validation over a long token stream."""
+    tokens = [
+        {"type": "identifier", "value": f"ev{i}", "line": i, "col": 1}
+        for i in range(10000)
+    ]
 
-    validator = Validator()
-    errors = validator.validate_ast(analyser.ast)
+    assert validator.validate_tokens(tokens) == []
 
-    assert len(errors) == 0
-
-
-def test_validate_ast_invalid():
-    """Test validation of invalid AST."""
-    # Invalid AST structure
-    ast = {"type": "invalid_type"}
 
-    validator = Validator()
-    errors = validator.validate_ast(ast)
-
-    assert len(errors) > 0
+def test_validate_ast(sample_ast, validator):
+    """Test AST validation."""
+    errors = validator.validate_ast(sample_ast)
 
+    assert len(errors) == 0
 
-def test_validate_law_data():
-    """Test law data validation."""
-    validator = Validator()
 
-    # Valid law data
-    law_data = {
-        "name": "test_law",
-        "date": "2024-01-01",
-        "time": "10:00",
-        "period": "1.0",
-        "dictionnary": [{"name": "A", "description": "Event A"}],
-        "group": [{"name": "A", "chronocoherence": "1.0", "chronodispersal": "0"}],
-    }
-
-    errors = validator.validate_law_data(law_data)
-    assert len(errors) == 0
+def test_validate_ast_invalid(validator):
+    """Test validation of invalid AST."""
+    errors = validator.validate_ast(_INVALID_AST)
 
-    # Invalid law data (missing fields)
-    invalid_law = {"name": "test"}
-    errors = validator.validate_law_data(invalid_law)
     assert len(errors) > 0
-    assert any("missing required field" in error.lower() for error in errors)
 
 
-def test_validate_law_data_invalid_date():
-    """Test law data validation with invalid date."""
-    validator = Validator()
+_BASE_LAW = {
+    "name": "test",
+    "date": "2024-01-01",
+    "time": "10:00",
+    "period": "1.0",
+    "dictionnary": [],
+    "group": [],
+}
 
-    law_data = {
-        "name": "test",
-        "date": "invalid-date",
-        "time": "10:00",
-        "period": "1.0",
-        "dictionnary": [],
-        "group": [],
-    }
 
-    errors = validator.validate_law_data(law_data)
-    assert len(errors) > 0
-    assert any("date" in error.lower() for error in errors)
+def _law(**overrides):
+    """Law data built from _BASE_LAW with the given fields replaced."""
+    return {**_BASE_LAW, **overrides}
 
 
-def test_validate_law_data_duplicate_dictionnary():
-    """Test law data validation with duplicate dictionnary entries."""
-    validator = Validator()
-
-    law_data = {
-        "name": "test",
-        "date": "2024-01-01",
-        "time": "10:00",
-        "period": "1.0",
-        "dictionnary": [
-            {"name": "A", "description": "First"},
-            {"name": "A", "description": "Duplicate"},  # Same name
-        ],
-        "group": [],
-    }
-
-    errors = validator.validate_law_data(law_data)
-    assert len(errors) > 0
-    assert any("duplicate" in error.lower() for error in errors)
+_EVENT_A = {"name": "A", "description": "Event A"}
 
 
-def test_validate_law_data_group_not_in_dictionnary():
-    """Test law data validation when group references missing dictionnary entry."""
-    validator = Validator()
-
-    law_data = {
-        "name": "test",
-        "date": "2024-01-01",
-        "time": "10:00",
-        "period": "1.0",
-        "dictionnary": [{"name": "A", "description": "Event A"}],
-        "group": [
+@pytest.mark.parametrize(
+    "overrides,substr",
+    [
+        pytest.param({}, None, id="valid-empty"),
+        pytest.param(
             {
-                "name": "B",
-                "chronocoherence": "1.0",
-                "chronodispersal": "0",
-            }  # B not in dictionnary
-        ],
-    }
-
-    errors = validator.validate_law_data(law_data)
-    assert len(errors) > 0
-    assert any("not found in dictionnary" in error for error in errors)
+                "dictionnary": [_EVENT_A],
+                "group": [
+                    {"name": "A", "chronocoherence": "1.0", "chronodispersal": "0"}
+                ],
+            },
+            None,
+            id="valid",
+        ),
+        pytest.param({"date": "invalid-date"}, "date", id="invalid-date"),
+        pytest.param({"period": "invalid"}, "period", id="invalid-period"),
+        pytest.param(
+            {
+                "dictionnary": [
+                    {"name": "A", "description": "First"},
+                    {"name": "A", "description": "Duplicate"},
+                ]
+            },
+            "duplicate",
+            id="duplicate-dictionnary",
+        ),
+        pytest.param(
+            {
+                "dictionnary": [_EVENT_A],
+                "group": [
+                    {"name": "B", "chronocoherence": "1.0", "chronodispersal": "0"}
+                ],
+            },
+            "not found in dictionnary",
+            id="group-not-in-dictionnary",
+        ),
+    ],
+)
+def test_validate_law_data(validator, overrides, substr):
+    """Test law data validation."""
+    errors = validator.validate_law_data(_law(**overrides))
 
+    if substr is None:
+        assert errors == []
+    else:
+        assert _has(errors, substr)
 
-def test_validate_law_data_invalid_period():
-    """Test law data validation with invalid period."""
-    validator = Validator()
 
-    law_data = {
-        "name": "test",
-        "date": "2024-01-01",
-        "time": "10:00",
-        "period": "invalid",
-        "dictionnary": [],
-        "group": [],
-    }
-
-    errors = validator.validate_law_data(law_data)
+def test_validate_law_data_missing_fields(validator):
+    """Test law data validation with missing required fields."""
+    errors = validator.validate_law_data({"name": "test"})
     assert len(errors) > 0
-    assert any("period" in error.lower() for error in errors)
+    assert _has(errors, "missing required field")
 
 
-def test_validate_code_line_length_warning():
-    """Test line length warning."""
-    validator = Validator()
-    # Should have warning about line length
-    warnings = validator.warnings
-    assert len(warnings) == 0
+def test_validate_code_size_thresholds(validator, monkeypatch):
+    """Test large file and long line warnings against the size thresholds."""
+    code = 'target t:\n    key:"long value"\nend_target'
 
+    # Below the default thresholds: no size warnings
+    validator.validate_code(code)
+    assert not _has(validator.warnings, "very large")
+    assert not _has(validator.warnings, "very long")
 
-def test_validate_code_large_file_warning():
-    """Test large file warning."""
-    validator = Validator()
-    # Should have warning about large file
-    warnings = validator.warnings
-    assert len(warnings) == 0
+    monkeypatch.setattr(validator_module, "MAX_CODE_SIZE", 20)
+    monkeypatch.setattr(validator_module, "MAX_LINE_LENGTH", 10)
+    validator.validate_code(code)
 
+    assert _has(validator.warnings, "very large")
+    assert _has(validator.warnings, "Line 2 is very long")
 
-def test_calculate_ast_size(sample_code):
-    """Test AST size calculation."""
-    analyser = ZenithAnalyser(sample_code)
-    validator = Validator()
 
-    size = validator._calculate_ast_size(analyser.ast)
+def test_calculate_ast_size(sample_ast, validator):
+    """Test AST size calculation."""
+    size = validator._calculate_ast_size(sample_ast)
     assert size > 0
     assert isinstance(size, int)
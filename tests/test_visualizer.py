@@ -82,6 +82,7 @@ class TestZenithVisualizer:
         viz_setup.plot_metrics_summary(mock_metrics_data, save_path=str(path))
         assert path.exists()
 
+    @pytest.mark.slow
     def test_create_all_plots(self, viz_setup, test_sims, tmp_path):
         """Vérifie que la fonction groupée génère bien tous les fichiers attendus."""
         output_dir = tmp_path / "plots"